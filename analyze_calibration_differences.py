@@ -11,10 +11,25 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import sys
 
+# Optional dependency: C-level JSON parser for large comparison reports
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # Add project paths
 project_root = pathlib.Path(__file__).parent
-sys.path.append(str(project_root / 'src'))
-sys.path.append(str(project_root))
+for path in map(str, (project_root / 'src', project_root)):
+    if path not in sys.path:
+        sys.path.append(path)
+
+def load_json_report(path):
+    """Load a JSON report, using orjson when it is installed"""
+    path = pathlib.Path(path)
+    if orjson is None:
+        with open(path, 'r') as f:
+            return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 def analyze_calibration_matrices():
     """Analyze transformation matrices from both calibration approaches"""
@@ -22,17 +37,16 @@ def analyze_calibration_matrices():
     print("=== Calibration Matrix Analysis ===\n")
     
     # Read comparison report
-    with open('results/calibration_comparison/calibration_comparison_20250725_175726.json', 'r') as f:
-        comparison = json.load(f)
+    comparison = load_json_report('results/calibration_comparison/calibration_comparison_20250725_175726.json')
     
     # Desktop calibration matrix
-    desktop_matrix = np.array(comparison['matrix_analysis']['desktop_matrix'])
+    desktop_matrix = np.asarray(comparison['matrix_analysis']['desktop_matrix'], dtype=np.float64)
     print("Desktop Calibration Matrix:")
     print(desktop_matrix)
     print(f"\nTranslation components (mm): [{desktop_matrix[0,3]:.2f}, {desktop_matrix[1,3]:.2f}, {desktop_matrix[2,3]:.2f}]")
     
     # Web calibration matrix  
-    web_matrix = np.array(comparison['matrix_analysis']['web_matrix'])
+    web_matrix = np.asarray(comparison['matrix_analysis']['web_matrix'], dtype=np.float64)
     print("\nWeb Calibration Matrix:")
     print(web_matrix)
     print(f"\nTranslation components (mm): [{web_matrix[0,3]:.2f}, {web_matrix[1,3]:.2f}, {web_matrix[2,3]:.2f}]")
@@ -81,6 +95,17 @@ def analyze_coordinate_systems():
     print("Web calibration Z-translation: +283.16mm (positive, in front of screen)")
     print("\nThis 815.66mm difference suggests opposite Z-axis conventions!")
     
+def transform_gazes(matrix, gazes):
+    """Map an (N,3) array of gaze vectors to screen coordinates with a 4x4 calibration matrix"""
+    
+    # Scale calculation (from HomTransform._getScale), one scale per vector
+    R = matrix[:3,:3]
+    t = matrix[:3,3]
+    scale = -t[2] / gazes[:,2]
+    
+    # The homogeneous w=1 only adds the translation column: s*(R @ g) + t
+    return scale[:,None] * (gazes @ R.T) + t
+
 def test_gaze_transformation(desktop_matrix, web_matrix):
     """Test gaze transformation with sample vectors"""
     
@@ -103,51 +128,58 @@ def test_gaze_transformation(desktop_matrix, web_matrix):
     
     print("Screen dimensions: {:.1f}mm x {:.1f}mm".format(screen_width_mm, screen_height_mm))
     
-    for i, (gaze, label) in enumerate(zip(test_gazes, labels)):
+    # Transform all test vectors at once for each calibration
+    gazes = np.stack(test_gazes)
+    screen_coords_d = transform_gazes(desktop_matrix, gazes)
+    screen_coords_w = transform_gazes(web_matrix, gazes)
+    
+    for gaze, label, coords_d, coords_w in zip(test_gazes, labels, screen_coords_d, screen_coords_w):
         print(f"\n{label} gaze vector: {gaze}")
-        
-        # Desktop transformation
-        # Scale calculation (from HomTransform._getScale)
-        scale_d = -desktop_matrix[2,3] / gaze[2]
-        gaze_scaled_d = scale_d * gaze
-        gaze_4d = np.append(gaze_scaled_d, 1)
-        screen_coords_d = desktop_matrix @ gaze_4d
-        
-        # Web transformation
-        scale_w = -web_matrix[2,3] / gaze[2]
-        gaze_scaled_w = scale_w * gaze
-        gaze_4d = np.append(gaze_scaled_w, 1)
-        screen_coords_w = web_matrix @ gaze_4d
-        
-        print(f"  Desktop: ({screen_coords_d[0]:.1f}, {screen_coords_d[1]:.1f})mm")
-        print(f"  Web:     ({screen_coords_w[0]:.1f}, {screen_coords_w[1]:.1f})mm")
+        print(f"  Desktop: ({coords_d[0]:.1f}, {coords_d[1]:.1f})mm")
+        print(f"  Web:     ({coords_w[0]:.1f}, {coords_w[1]:.1f})mm")
         
     return test_gazes
 
-def visualize_calibration_points():
-    """Visualize calibration points on screen"""
+def load_calibration_targets(csv_path, chunksize=200_000):
+    """Read only the target columns of a calibration CSV and return the unique (x, y) positions"""
+    
+    reader = pd.read_csv(csv_path, usecols=['set_x', 'set_y'], dtype=np.float32,
+                         engine='c', chunksize=chunksize)
+    uniques = [np.unique(chunk.to_numpy(), axis=0) for chunk in reader]
+    if not uniques:
+        return np.empty((0, 2), dtype=np.float32)
+    return np.unique(np.concatenate(uniques), axis=0)
+
+def visualize_calibration_points(fig=None):
+    """
+    Visualize calibration points on screen. Pass a two-axes figure to reuse
+    it across calls; its axes are cleared after saving instead of closing it
+    """
     
     print("\n\n=== Visualizing Calibration Points ===\n")
     
-    # Read calibration data
-    desktop_calib = pd.read_csv('results/interview_calibrations/test_desktop_1_calibration.csv')
-    web_calib = pd.read_csv('results/interview_calibrations/test_3/test_3_calibration.csv')
+    # Read unique calibration target positions
+    desktop_targets = load_calibration_targets('results/interview_calibrations/test_desktop_1_calibration.csv')
+    web_targets = load_calibration_targets('results/interview_calibrations/test_3/test_3_calibration.csv')
     
     # Screen dimensions
     screen_width_mm = 474.13
     screen_height_mm = 296.33
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
+    owns_fig = fig is None
+    if owns_fig:
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
+    else:
+        ax1, ax2 = fig.axes
     
     # Desktop calibration points
     ax1.set_title('Desktop Calibration Target Points')
     ax1.add_patch(Rectangle((0, 0), screen_width_mm, screen_height_mm, 
                            fill=False, edgecolor='black', linewidth=2))
     
-    # Extract unique target positions
-    desktop_targets = desktop_calib[['set_x', 'set_y']].drop_duplicates()
-    ax1.scatter(desktop_targets['set_x'], desktop_targets['set_y'], 
-               s=100, c='red', marker='x', label='Targets')
+    ax1.scatter(desktop_targets[:, 0], desktop_targets[:, 1], 
+               s=100, c='red', marker='x', label='Targets',
+               rasterized=True, zorder=1)
     ax1.set_xlim(-50, screen_width_mm + 50)
     ax1.set_ylim(-50, screen_height_mm + 50)
     ax1.set_xlabel('X (mm)')
@@ -159,18 +191,22 @@ def visualize_calibration_points():
     ax2.add_patch(Rectangle((0, 0), screen_width_mm, screen_height_mm, 
                            fill=False, edgecolor='black', linewidth=2))
     
-    web_targets = web_calib[['set_x', 'set_y']].drop_duplicates()
-    ax2.scatter(web_targets['set_x'], web_targets['set_y'], 
-               s=100, c='blue', marker='x', label='Targets')
+    ax2.scatter(web_targets[:, 0], web_targets[:, 1], 
+               s=100, c='blue', marker='x', label='Targets',
+               rasterized=True, zorder=1)
     ax2.set_xlim(-50, screen_width_mm + 50)
     ax2.set_ylim(-50, screen_height_mm + 50)
     ax2.set_xlabel('X (mm)')
     ax2.set_ylabel('Y (mm)')
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('results/calibration_comparison/calibration_points_comparison.png', dpi=150)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('results/calibration_comparison/calibration_points_comparison.png', dpi=150)
+    if owns_fig:
+        plt.close(fig)
+    else:
+        for ax in (ax1, ax2):
+            ax.cla()
     
     print(f"Desktop calibration points: {len(desktop_targets)}")
     print(f"Web calibration points: {len(web_targets)}")
@@ -14,6 +14,11 @@ Test Plan:
 """
 
 import sys
+import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import pathlib
 import cv2
 import numpy as np
@@ -22,21 +27,133 @@ import json
 from datetime import datetime
 import shutil
 
+# Optional dependency: C-level JSON parser/encoder with native numpy support
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Optional dependency: multithreaded CSV parser and Parquet summaries
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    pa = None
+
 # Add project paths
 project_root = pathlib.Path(__file__).parent
-sys.path.append(str(project_root / 'scripts' / 'interview'))
+interview_dir = str(project_root / 'scripts' / 'interview')
+if interview_dir not in sys.path:
+    sys.path.append(interview_dir)
 
 from analyzer import InterviewVideoAnalyzer
 from calibration import InterviewCalibrationSystem
 
+# Candidate ID used for the desktop reference calibration
+DESKTOP_ID = "test_desktop_1"
+
+# Bump when analyzer output changes to invalidate cached analyses
+ANALYSIS_CACHE_VERSION = 1
+
+# Files making up one saved calibration: <base_path><suffix>
+CALIB_FILE_SUFFIXES = ('_calibration.csv', '_transform_matrix.npz', '_screen_info.json')
+
+def _load_calibration_csv(csv_path):
+    """Read a calibration CSV, with pyarrow's multithreaded parser when available"""
+    if pa is not None:
+        return pa_csv.read_csv(csv_path).to_pandas()
+    return pd.read_csv(csv_path)
+
+def _load_calibration_npz(npz_path):
+    """Read STransG from a transform matrix NPZ"""
+    # Only the numeric STransG entry is compared; other entries (e.g. a
+    # pickled StG of None) are never unpickled
+    with np.load(npz_path) as npz_data:
+        return {'STransG': npz_data['STransG']}
+
+def _load_screen_info_json(json_path):
+    """Read a screen info JSON, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(pathlib.Path(json_path).read_bytes())
+    with open(json_path) as f:
+        return json.load(f)
+
+@functools.lru_cache(maxsize=32)
+def _load_raw_calibration_files(base_path, mtimes):
+    """
+    Read a calibration's CSV, NPZ and JSON files concurrently. mtimes holds one
+    modification time per CALIB_FILE_SUFFIXES entry (None for a missing file)
+    and is part of the cache key
+    """
+    loaders = {
+        'csv': (_load_calibration_csv, f"{base_path}_calibration.csv"),
+        'npz': (_load_calibration_npz, f"{base_path}_transform_matrix.npz"),
+        'json': (_load_screen_info_json, f"{base_path}_screen_info.json")
+    }
+    
+    # The parsers spend their time in I/O and C code that releases the GIL
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures = {
+            key: executor.submit(loader, path)
+            for (key, (loader, path)), mtime in zip(loaders.items(), mtimes)
+            if mtime is not None
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+def _scan_calib(base_dir):
+    """Map file name -> os.DirEntry with a single directory read; None if the directory is missing"""
+    try:
+        with os.scandir(base_dir) as entries:
+            return {entry.name: entry for entry in entries}
+    except FileNotFoundError:
+        return None
+
+def _video_fingerprint(video_path):
+    """Fast content key for a video: BLAKE2b of its first MiB plus its size"""
+    with open(video_path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(1 << 20), digest_size=8).hexdigest()
+    return f"{digest}_{os.path.getsize(video_path)}"
+
+def clear_calibration_cache():
+    """Forget calibration files loaded by CalibrationComparison"""
+    _load_raw_calibration_files.cache_clear()
+
+def _json_default(obj):
+    """Fallback serializer for json.dump"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+def write_json_report(path, data):
+    """Write a report as indented JSON, serializing numpy arrays directly with orjson when available"""
+    if orjson is None:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_json_default)
+        return
+    pathlib.Path(path).write_bytes(
+        orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+    )
+
 class CalibrationComparison:
     """Compare desktop vs web calibration results"""
     
     def __init__(self):
-        self.analyzer = InterviewVideoAnalyzer()
-        self.desktop_calib = InterviewCalibrationSystem()
         self.results_dir = pathlib.Path("results/calibration_comparison")
         self.results_dir.mkdir(exist_ok=True, parents=True)
+        self.analysis_cache_dir = pathlib.Path("results/analysis_cache")
+    
+    @functools.cached_property
+    def analyzer(self):
+        """Video analyzer, built on first use"""
+        return InterviewVideoAnalyzer()
+    
+    @functools.cached_property
+    def desktop_calib(self):
+        """Desktop calibration system, built on first use"""
+        return InterviewCalibrationSystem()
         
     def show_menu(self):
         """Display comparison menu"""
@@ -78,7 +195,7 @@ class CalibrationComparison:
         print("\n🖥️  Desktop Calibration Setup")
         print("-" * 40)
         
-        candidate_id = "test_desktop_1"
+        candidate_id = DESKTOP_ID
         print(f"Creating desktop calibration for: {candidate_id}")
         print("\nThis will:")
         print("1. Collect screen information")
@@ -112,14 +229,14 @@ class CalibrationComparison:
             import traceback
             traceback.print_exc()
             
-    def compare_calibration_files(self):
-        """Compare desktop vs web calibration files"""
+    def compare_calibration_files(self, web_id=None, desktop_id=DESKTOP_ID, include_matrices=False):
+        """Compare desktop vs web calibration files, prompting for missing inputs"""
         print("\n📊 Calibration Files Comparison")
         print("-" * 40)
         
         # Check available calibrations
-        desktop_id = "test_desktop_1"
-        web_id = input("Enter web calibration candidate ID to compare: ").strip()
+        if web_id is None:
+            web_id = input("Enter web calibration candidate ID to compare: ").strip()
         
         if not web_id:
             print("❌ Invalid web candidate ID")
@@ -131,14 +248,15 @@ class CalibrationComparison:
             web_calib = self._load_calibration_data(web_id, "web")
             
             # Compare and save results
-            comparison = self._compare_calibrations(desktop_calib, web_calib)
+            comparison = self._compare_calibrations(desktop_calib, web_calib, include_matrices)
             
             # Save comparison report
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             report_path = self.results_dir / f"calibration_comparison_{timestamp}.json"
             
-            with open(report_path, 'w') as f:
-                json.dump(comparison, f, indent=2, default=str)
+            write_json_report(report_path, comparison)
+            self._append_to_index(report_path, desktop_id=desktop_id, web_id=web_id)
+            self._append_summary_row(self._calibration_summary_row(comparison, report_path))
                 
             print(f"\n📈 Comparison saved to: {report_path}")
             self._display_comparison_summary(comparison)
@@ -148,15 +266,16 @@ class CalibrationComparison:
             import traceback
             traceback.print_exc()
             
-    def analyze_with_both_calibrations(self):
-        """Analyze same video with both calibrations"""
+    def analyze_with_both_calibrations(self, web_id=None, video_path=None, desktop_id=DESKTOP_ID):
+        """Analyze same video with both calibrations, prompting for missing inputs"""
         print("\n🎥 Video Analysis Comparison")
         print("-" * 40)
         
         # Get inputs
-        desktop_id = "test_desktop_1"
-        web_id = input("Enter web calibration candidate ID: ").strip()
-        video_path = input("Enter video path to analyze: ").strip()
+        if web_id is None:
+            web_id = input("Enter web calibration candidate ID: ").strip()
+        if video_path is None:
+            video_path = input("Enter video path to analyze: ").strip()
         
         if not web_id or not video_path:
             print("❌ Invalid inputs")
@@ -173,20 +292,13 @@ class CalibrationComparison:
         print(f"Video: {video_file.name}")
         
         try:
-            # Analyze with desktop calibration
-            print(f"\n1️⃣ Analyzing with desktop calibration ({desktop_id})...")
-            desktop_result = self.analyzer.analyze_interview_video(
-                video_path=str(video_file),
-                candidate_id=desktop_id,
-                output_name=f"desktop_{video_file.stem}_{timestamp}"
-            )
-            
-            # Analyze with web calibration  
-            print(f"\n2️⃣ Analyzing with web calibration ({web_id})...")
-            web_result = self.analyzer.analyze_interview_video(
-                video_path=str(video_file),
-                candidate_id=web_id,
-                output_name=f"web_{video_file.stem}_{timestamp}"
+            # Decode the video and estimate gaze once, map it with both calibrations
+            print(f"\n1️⃣ Desktop calibration: {desktop_id}")
+            print(f"2️⃣ Web calibration: {web_id}")
+            desktop_result, web_result = self._cached_analyze(
+                video_file,
+                [desktop_id, web_id],
+                [f"desktop_{video_file.stem}_{timestamp}", f"web_{video_file.stem}_{timestamp}"]
             )
             
             if desktop_result and web_result:
@@ -197,8 +309,21 @@ class CalibrationComparison:
                 
                 # Save comparison
                 comparison_path = self.results_dir / f"analysis_comparison_{timestamp}.json"
-                with open(comparison_path, 'w') as f:
-                    json.dump(analysis_comparison, f, indent=2, default=str)
+                write_json_report(comparison_path, analysis_comparison)
+                self._append_to_index(comparison_path, desktop_id=desktop_id, web_id=web_id,
+                                      video=video_file.name)
+                self._append_summary_row({
+                    'kind': 'analysis',
+                    'timestamp': analysis_comparison['timestamp'],
+                    'report_file': comparison_path.name,
+                    'desktop_id': desktop_id,
+                    'web_id': web_id,
+                    'video': video_file.name,
+                    'detection_rate_desktop': analysis_comparison['desktop_analysis']['detection_rate'],
+                    'detection_rate_web': analysis_comparison['web_analysis']['detection_rate'],
+                    'on_screen_rate_desktop': analysis_comparison['desktop_analysis']['on_screen_rate'],
+                    'on_screen_rate_web': analysis_comparison['web_analysis']['on_screen_rate']
+                })
                     
                 print(f"\n📊 Analysis comparison saved to: {comparison_path}")
                 self._display_analysis_comparison(analysis_comparison)
@@ -211,52 +336,95 @@ class CalibrationComparison:
             import traceback
             traceback.print_exc()
             
-    def _load_calibration_data(self, candidate_id, calib_type):
-        """Load calibration data for comparison"""
-        try:
-            calib_data = self.desktop_calib.load_candidate_calibration(candidate_id)
-            
-            # Load raw files for detailed comparison
-            calib_dir = pathlib.Path("results/interview_calibrations")
-            
-            # Check if structured directory exists
-            structured_dir = calib_dir / candidate_id
-            if structured_dir.exists():
-                base_path = structured_dir / candidate_id
+    def _cached_analyze(self, video_file, candidate_ids, output_names):
+        """
+        Analyze a video with several calibrations, reusing earlier results for
+        the same video content and unchanged calibration files
+        """
+        self.analysis_cache_dir.mkdir(exist_ok=True, parents=True)
+        video_key = _video_fingerprint(video_file)
+        
+        results = {}
+        missing = []
+        for candidate_id, output_name in zip(candidate_ids, output_names):
+            _, mtimes = self._locate_calibration(candidate_id)
+            calib_key = hashlib.blake2b(repr(mtimes).encode(), digest_size=4).hexdigest()
+            cache_path = self.analysis_cache_dir / f"{video_key}_{candidate_id}_{calib_key}.json"
+            record = None
+            if cache_path.exists():
+                try:
+                    with open(cache_path, 'rb') as f:
+                        record = json.load(f)
+                except ValueError:
+                    # Truncated or corrupt record: analyze again and overwrite it
+                    record = None
+            if isinstance(record, dict) and record.get('analyzer_version') == ANALYSIS_CACHE_VERSION:
+                results[candidate_id] = record['report']
+                print(f"♻️  Using cached analysis for {candidate_id}: {cache_path}")
             else:
-                base_path = calib_dir / candidate_id
+                missing.append((candidate_id, output_name, cache_path))
                 
-            raw_data = {}
+        if missing:
+            reports = self.analyzer.analyze_with_calibrations(
+                video_path=str(video_file),
+                candidate_ids=[candidate_id for candidate_id, _, _ in missing],
+                output_names=[output_name for _, output_name, _ in missing]
+            )
+            for (candidate_id, _, cache_path), report in zip(missing, reports):
+                if report is not None:
+                    # Same form as the saved report, so cache hits and misses compare alike
+                    report = self.analyzer._to_json_serializable(report)
+                    write_json_report(cache_path, {'analyzer_version': ANALYSIS_CACHE_VERSION,
+                                                   'report': report})
+                results[candidate_id] = report
+                        
+        return [results[candidate_id] for candidate_id in candidate_ids]
             
-            # Load CSV
-            csv_path = f"{base_path}_calibration.csv"
-            if pathlib.Path(csv_path).exists():
-                raw_data['csv'] = pd.read_csv(csv_path)
-                
-            # Load NPZ
-            npz_path = f"{base_path}_transform_matrix.npz"
-            if pathlib.Path(npz_path).exists():
-                npz_data = np.load(npz_path, allow_pickle=True)
-                raw_data['npz'] = {key: npz_data[key] for key in npz_data.keys()}
-                
-            # Load JSON
-            json_path = f"{base_path}_screen_info.json"
-            if pathlib.Path(json_path).exists():
-                with open(json_path) as f:
-                    raw_data['json'] = json.load(f)
+    def _locate_calibration(self, candidate_id):
+        """
+        Find a candidate's calibration files. Returns the base path and the
+        modification times of CALIB_FILE_SUFFIXES (None for missing files)
+        """
+        calib_dir = pathlib.Path("results/interview_calibrations")
+        
+        # Check if structured directory exists
+        structured_dir = calib_dir / candidate_id
+        entries = _scan_calib(structured_dir)
+        if entries is not None:
+            base_path = structured_dir / candidate_id
+        else:
+            base_path = calib_dir / candidate_id
+            entries = _scan_calib(calib_dir) or {}
+            
+        file_entries = [entries.get(f"{candidate_id}{suffix}") for suffix in CALIB_FILE_SUFFIXES]
+        mtimes = tuple(entry.stat().st_mtime if entry is not None else None
+                       for entry in file_entries)
+        return base_path, mtimes
+            
+    def _load_calibration_data(self, candidate_id, calib_type):
+        """Load calibration data for comparison"""
+        try:
+            # Load raw files for detailed comparison; they are cached across
+            # menu iterations until they change on disk
+            base_path, mtimes = self._locate_calibration(candidate_id)
+            if mtimes[1] is None:
+                raise FileNotFoundError(f"No transform matrix found at {base_path}_transform_matrix.npz")
+            raw_data = _load_raw_calibration_files(str(base_path), mtimes)
                     
             return {
                 'type': calib_type,
                 'candidate_id': candidate_id,
-                'calib_data': calib_data,
                 'raw_data': raw_data
             }
             
         except Exception as e:
             raise Exception(f"Failed to load {calib_type} calibration for {candidate_id}: {e}")
             
-    def _compare_calibrations(self, desktop, web):
-        """Compare desktop vs web calibration data"""
+    def _compare_calibrations(self, desktop, web, include_matrices=False):
+        """
+        Compare desktop vs web calibration data. The raw matrices are only
+        included in the report when include_matrices is set
+        """
         comparison = {
             'timestamp': datetime.now().isoformat(),
             'desktop_id': desktop['candidate_id'],
@@ -283,10 +451,25 @@ class CalibrationComparison:
         comparison['matrix_analysis'] = {
             'desktop_shape': desktop_matrix.shape,
             'web_shape': web_matrix.shape,
-            'shape_match': desktop_matrix.shape == web_matrix.shape,
-            'desktop_matrix': desktop_matrix.tolist(),
-            'web_matrix': web_matrix.tolist()
+            'shape_match': desktop_matrix.shape == web_matrix.shape
         }
+        if include_matrices:
+            comparison['matrix_analysis']['desktop_matrix'] = desktop_matrix
+            comparison['matrix_analysis']['web_matrix'] = web_matrix
+        
+        # Incompatible calibrations, the detailed comparison is meaningless
+        if not comparison['matrix_analysis']['shape_match']:
+            comparison['matrix_analysis']['skipped_detailed'] = True
+            return comparison
+        
+        # Numerical differences between the matrices
+        abs_diff = np.abs(desktop_matrix - web_matrix)
+        comparison['matrix_analysis'].update({
+            'allclose': bool(np.allclose(desktop_matrix, web_matrix, rtol=1e-6)),
+            'frobenius_diff': float(np.linalg.norm(desktop_matrix - web_matrix)),
+            'max_abs_diff': float(abs_diff.max()),
+            'mean_abs_diff': float(abs_diff.mean())
+        })
         
         # Compare calibration CSV data
         if 'csv' in desktop['raw_data'] and 'csv' in web['raw_data']:
@@ -304,20 +487,18 @@ class CalibrationComparison:
             # Compare gaze data ranges
             if 'gaze_x' in desktop_csv.columns and 'gaze_x' in web_csv.columns:
                 comparison['gaze_ranges'] = {
-                    'desktop': {
-                        'gaze_x': [float(desktop_csv['gaze_x'].min()), float(desktop_csv['gaze_x'].max())],
-                        'gaze_y': [float(desktop_csv['gaze_y'].min()), float(desktop_csv['gaze_y'].max())],
-                        'gaze_z': [float(desktop_csv['gaze_z'].min()), float(desktop_csv['gaze_z'].max())]
-                    },
-                    'web': {
-                        'gaze_x': [float(web_csv['gaze_x'].min()), float(web_csv['gaze_x'].max())],
-                        'gaze_y': [float(web_csv['gaze_y'].min()), float(web_csv['gaze_y'].max())],
-                        'gaze_z': [float(web_csv['gaze_z'].min()), float(web_csv['gaze_z'].max())]
-                    }
+                    'desktop': self._gaze_ranges(desktop_csv),
+                    'web': self._gaze_ranges(web_csv)
                 }
         
         return comparison
         
+    def _gaze_ranges(self, csv):
+        """[min, max] of each gaze component, from one reduction over the columns"""
+        columns = ['gaze_x', 'gaze_y', 'gaze_z']
+        bounds = csv[columns].agg(['min', 'max']).astype(float)
+        return {column: bounds[column].tolist() for column in columns}
+        
     def _compare_analysis_results(self, desktop_result, web_result, video_name):
         """Compare analysis results from both calibrations"""
         return {
@@ -357,9 +538,13 @@ class CalibrationComparison:
         print(f"🔢 Matrix Shape: {'✅ Match' if shape_match else '❌ Mismatch'}")
         print(f"   Desktop: {matrix_info['desktop_shape']}")
         print(f"   Web: {matrix_info['web_shape']}")
+        if 'frobenius_diff' in matrix_info:
+            print(f"   Values: {'✅ Equal' if matrix_info['allclose'] else '❌ Different'}")
+            print(f"   Frobenius norm of difference: {matrix_info['frobenius_diff']:.4f}")
+            print(f"   Max / mean abs difference: {matrix_info['max_abs_diff']:.4f} / {matrix_info['mean_abs_diff']:.4f}")
         
         # Data quality
-        if 'data_quality' in comparison:
+        if comparison.get('data_quality'):
             quality = comparison['data_quality']
             print(f"\n📋 Calibration Data:")
             print(f"   Desktop rows: {quality['desktop_rows']}")
@@ -404,36 +589,148 @@ class CalibrationComparison:
     def generate_comparison_report(self):
         """Generate comprehensive comparison report"""
         print("\n📝 Generating Comprehensive Report...")
+        
+        # Key metrics of all saved comparisons, from one columnar read
+        if pa is not None and self.summary_path.exists():
+            summary = pq.read_table(self.summary_path).to_pandas()
+            for kind, rows in summary.groupby('kind'):
+                print(f"\n📋 {kind.capitalize()} comparisons ({len(rows)}):")
+                print(rows.dropna(axis=1, how='all').drop(columns='kind').to_string(index=False))
+                
         # This would create a detailed markdown report
         print("This feature will create a detailed markdown report comparing all aspects.")
         
+    @property
+    def summary_path(self):
+        """Parquet table with one row of key metrics per saved comparison"""
+        return self.results_dir / "comparisons.parquet"
+        
+    def _calibration_summary_row(self, comparison, report_path):
+        """Flatten the scalar metrics of a calibration comparison"""
+        matrix_info = comparison['matrix_analysis']
+        quality = comparison.get('data_quality', {})
+        return {
+            'kind': 'calibration',
+            'timestamp': comparison['timestamp'],
+            'report_file': pathlib.Path(report_path).name,
+            'desktop_id': comparison['desktop_id'],
+            'web_id': comparison['web_id'],
+            'screen_info_identical': comparison['differences']['screen_info']['identical'],
+            'shape_match': matrix_info['shape_match'],
+            'allclose': matrix_info.get('allclose'),
+            'frobenius_diff': matrix_info.get('frobenius_diff'),
+            'max_abs_diff': matrix_info.get('max_abs_diff'),
+            'mean_abs_diff': matrix_info.get('mean_abs_diff'),
+            'desktop_rows': quality.get('desktop_rows'),
+            'web_rows': quality.get('web_rows')
+        }
+        
+    def _append_summary_row(self, row):
+        """Append one row to the Parquet summary of all comparisons (needs pyarrow)"""
+        if pa is None:
+            return
+        summary = pd.DataFrame([row])
+        if self.summary_path.exists():
+            summary = pd.concat([pq.read_table(self.summary_path).to_pandas(), summary],
+                                ignore_index=True)
+        pq.write_table(pa.Table.from_pandas(summary, preserve_index=False), self.summary_path)
+        
+    @property
+    def index_path(self):
+        """Append-only index of saved reports, one JSON object per line"""
+        return self.results_dir / "_index.jsonl"
+        
+    def _ensure_index(self, exclude=None):
+        """Build the results index from the directory listing if it does not exist yet"""
+        if self.index_path.exists():
+            return
+        with open(self.index_path, 'w') as f:
+            for file in sorted(self.results_dir.glob("*.json")):
+                if file.name != exclude:
+                    f.write(json.dumps({'file': file.name}) + "\n")
+        
+    def _append_to_index(self, report_path, **metadata):
+        """Record a saved report in the results index"""
+        name = pathlib.Path(report_path).name
+        self._ensure_index(exclude=name)
+        entry = {'file': name, 'ts': datetime.now().isoformat(), **metadata}
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps(entry) + "\n")
+            
+    def _read_index(self):
+        """Read the results index"""
+        self._ensure_index()
+        with open(self.index_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+        
+    def _remove_from_index(self, name):
+        """Drop the entries for a report from the results index"""
+        entries = [entry for entry in self._read_index() if entry['file'] != name]
+        with open(self.index_path, 'w') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+        
     def view_existing_results(self):
         """View existing comparison results"""
         print("\n📁 Existing Comparison Results:")
-        comparison_files = list(self.results_dir.glob("*.json"))
+        entries = self._read_index()
         
-        if not comparison_files:
+        if not entries:
             print("No comparison results found.")
             return
             
-        for i, file in enumerate(comparison_files, 1):
-            print(f"{i}. {file.name}")
+        for i, entry in enumerate(entries, 1):
+            details = ", ".join(f"{key}: {value}" for key, value in entry.items() if key != 'file')
+            print(f"{i}. {entry['file']}" + (f" ({details})" if details else ""))
+        comparison_files = [self.results_dir / entry['file'] for entry in entries]
             
         try:
             choice = int(input("\nEnter file number to view: ")) - 1
             if 0 <= choice < len(comparison_files):
-                with open(comparison_files[choice]) as f:
-                    data = json.load(f)
-                print(json.dumps(data, indent=2))
+                # Reports are saved indented, print them without re-parsing
+                sys.stdout.flush()
+                with open(comparison_files[choice], 'rb') as f:
+                    shutil.copyfileobj(f, sys.stdout.buffer)
+                sys.stdout.buffer.flush()
+                print()
             else:
                 print("Invalid choice")
         except ValueError:
             print("Invalid input")
+        except FileNotFoundError as e:
+            # The report was deleted or moved since it was indexed
+            print(f"Report not found: {e}")
+            self._remove_from_index(entries[choice]['file'])
+        except OSError as e:
+            print(f"Could not read report: {e}")
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Compare desktop vs web calibration")
+    parser.add_argument('--action', choices=['compare', 'analyze', 'report'],
+                        help="run one action and exit instead of the interactive menu")
+    parser.add_argument('--desktop-id', default=DESKTOP_ID, help="desktop calibration candidate ID")
+    parser.add_argument('--web-id', help="web calibration candidate ID")
+    parser.add_argument('--video', help="video to analyze with both calibrations")
+    parser.add_argument('--include-matrices', action='store_true',
+                        help="store the raw transformation matrices in comparison reports")
+    args = parser.parse_args()
+    
+    if args.action in ('compare', 'analyze') and not args.web_id:
+        parser.error(f"--action {args.action} requires --web-id")
+    if args.action == 'analyze' and not args.video:
+        parser.error("--action analyze requires --video")
+    
     tester = CalibrationComparison()
-    tester.run()
+    if args.action is None:
+        tester.run()
+    elif args.action == 'compare':
+        tester.compare_calibration_files(args.web_id, desktop_id=args.desktop_id,
+                                         include_matrices=args.include_matrices)
+    elif args.action == 'analyze':
+        tester.analyze_with_both_calibrations(args.web_id, args.video, desktop_id=args.desktop_id)
+    elif args.action == 'report':
+        tester.generate_comparison_report()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
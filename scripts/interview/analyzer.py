@@ -7,68 +7,364 @@ to map gaze to screen coordinates and detect potential cheating behavior.
 """
 
 import pathlib
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import cv2
 import numpy as np
 import pandas as pd
 import json
-import matplotlib.pyplot as plt
-import seaborn as sns
+import queue
+import threading
 import sys
-from omegaconf import OmegaConf
+import torch
 
-# Add project paths
+# Optional dependency: multithreaded CSV writer and Parquet output for long videos
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Optional dependency: C-level JSON encoder for reports
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Add project paths once; analyzer and calibration both run this on import
 project_root = pathlib.Path(__file__).parent.parent.parent
-sys.path.append(str(project_root / 'src'))
-sys.path.append(str(project_root))
+for path in map(str, (project_root / 'src', project_root)):
+    if path not in sys.path:
+        sys.path.append(path)
 
 from src.plgaze.model_pl_gaze import GazeModel
 from src.gaze_tracking.homtransform import HomTransform
-from scripts.interview.calibration import InterviewCalibrationSystem
+from scripts.interview.calibration import InterviewCalibrationSystem, load_gaze_config
 from utils.platform_utils import get_platform_manager
 
+# Per-frame float columns of the results CSV; NaN means no face or no screen mapping
+FLOAT_COLUMNS = ('gaze_x', 'gaze_y', 'gaze_z', 'screen_x_mm', 'screen_y_mm',
+                 'screen_x_px', 'screen_y_px', 'yaw', 'pitch', 'roll')
+
+# Zone columns are stored as int8 codes into these categories; code 0 ('no_face') is the default
+ZONE_CATEGORIES = {
+    'zone_horizontal': ('no_face', 'unknown', 'left', 'center', 'right'),
+    'zone_vertical': ('no_face', 'unknown', 'top', 'middle', 'bottom')
+}
+ZONE_CODES = {name: {label: code for code, label in enumerate(labels)}
+              for name, labels in ZONE_CATEGORIES.items()}
+
+class FrameReader:
+    """
+    Decodes frames from a cv2.VideoCapture on a background thread so that
+    video decoding overlaps with gaze inference on the main thread
+    """
+    
+    def __init__(self, cap, maxsize=8, stride=1):
+        self.cap = cap
+        # Only every stride-th frame is decoded; the others are just grabbed
+        self.stride = stride
+        self.queue = queue.Queue(maxsize=maxsize)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._reader, daemon=True)
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def read(self):
+        """Same contract as cv2.VideoCapture.read()"""
+        frame = self.queue.get()
+        return frame is not None, frame
+    
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+    
+    def _reader(self):
+        index = 0
+        while not self._stopped.is_set():
+            if index % self.stride:
+                # grab() demuxes the packet without decoding it
+                if not self.cap.grab():
+                    break
+            else:
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                self._put(frame)
+            index += 1
+        # Sentinel marks the end of the stream
+        self._put(None)
+    
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+class CsvChunkWriter:
+    """
+    Appends DataFrame chunks to one CSV file, writing the header once, so
+    results become visible on disk while a long video is still processing
+    """
+    
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self._file = None
+        self._writer = None
+    
+    def write(self, df):
+        if pa is not None:
+            # pyarrow's C++ writer when available
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            # Write categorical columns as their labels
+            table = table.cast(pa.schema([
+                pa.field(field.name, field.type.value_type) if pa.types.is_dictionary(field.type) else field
+                for field in table.schema
+            ]))
+            if self._writer is None:
+                self._writer = pa_csv.CSVWriter(str(self.csv_path), table.schema)
+            self._writer.write_table(table)
+            return
+        
+        header = self._file is None
+        if self._file is None:
+            self._file = open(self.csv_path, 'w', newline='')
+        df.to_csv(self._file, header=header, index=False)
+        self._file.flush()
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class ParquetChunkWriter:
+    """
+    Appends DataFrame chunks to one zstd-compressed Parquet file (needs
+    pyarrow); zone categoricals stay dictionary-encoded
+    """
+    
+    def __init__(self, parquet_path):
+        self.parquet_path = parquet_path
+        self._writer = None
+    
+    def write(self, df):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(str(self.parquet_path), table.schema,
+                                            compression='zstd')
+        self._writer.write_table(table)
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
 class InterviewVideoAnalyzer:
     """
     Analyzes interview videos for gaze patterns and potential cheating
     """
     
-    def __init__(self):
+    def __init__(self, batch_size=16, csv_chunk_size=1000, gaze_model=None, output_format='csv'):
+        # Frames per batched gaze-network forward pass
+        self.batch_size = batch_size
+        
+        # Frames between appends to the results file
+        self.csv_chunk_size = csv_chunk_size
+        
+        # Per-frame results file: 'csv' or 'parquet' (needs pyarrow)
+        if output_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unknown output format: {output_format}")
+        if output_format == 'parquet' and pa is None:
+            print("⚠️ pyarrow is not installed, writing CSV instead of Parquet")
+            output_format = 'csv'
+        self.output_format = output_format
+        
         # Get platform manager
         self.platform_manager = get_platform_manager()
         
         # Initialize calibration system
         self.calib_system = InterviewCalibrationSystem()
         
-        # Load gaze estimation config
-        project_root = pathlib.Path(__file__).parent.parent.parent
-        package_root = project_root / 'src'
-        config_path = package_root / 'plgaze/data/configs/eth-xgaze.yaml'
-        self.config = OmegaConf.load(config_path)
-        self.config.PACKAGE_ROOT = package_root.as_posix()
-        
-        # Optimize config for current platform
-        self._optimize_config_for_platform()
+        # Load gaze estimation config with platform-specific optimizations
+        self.config = load_gaze_config()
         
         # Results directory
         self.analysis_dir = pathlib.Path("results/interview_analysis")
         self.analysis_dir.mkdir(exist_ok=True, parents=True)
         
-        # Initialize gaze model
-        self.gaze_model = GazeModel(self.config)
+        # Gaze model is built on first use and reused for every video
+        self._gaze_model = gaze_model
     
-    def _optimize_config_for_platform(self):
-        """Optimize config for current platform"""
-        if self.platform_manager.is_mac_silicon:
-            # Mac Silicon optimizations
-            if hasattr(self.config, 'device'):
-                self.config.device = 'mps'
-        elif self.platform_manager.system == 'windows':
-            # Windows optimizations
-            if hasattr(self.config, 'num_workers'):
-                self.config.num_workers = min(self.config.get('num_workers', 4), 2)
+    @property
+    def gaze_model(self):
+        """Shared GazeModel, loaded once per analyzer"""
+        if self._gaze_model is None:
+            self._gaze_model = GazeModel(self.config)
+        return self._gaze_model
+    
+    def _open_video(self, video_path):
+        """
+        Open a video file, requesting hardware-accelerated decoding when the
+        OpenCV build supports it and falling back to software decoding
+        """
+        if hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            # Device 0 is the worker's GPU when CUDA_VISIBLE_DEVICES pins it
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG,
+                                   [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+                                    cv2.CAP_PROP_HW_DEVICE, 0])
+            if cap.isOpened():
+                if cap.get(cv2.CAP_PROP_HW_ACCELERATION) != cv2.VIDEO_ACCELERATION_NONE:
+                    print("✅ Using hardware-accelerated video decoding")
+                return cap
+            cap.release()
+        return cv2.VideoCapture(video_path)
+        
+    def analyze_interview_video(self, video_path, candidate_id, output_name=None, sample_stride=1,
+                                generate_plots=True):
+        """
+        Analyze an interview video using the candidate's calibration data,
+        estimating gaze on every sample_stride-th frame (None picks a stride
+        giving about 15 samples per second)
+        """
+        output_names = None if output_name is None else [output_name]
+        return self.analyze_with_calibrations(video_path, [candidate_id], output_names,
+                                              sample_stride, generate_plots)[0]
+    
+    def analyze_with_calibrations(self, video_path, candidate_ids, output_names=None, sample_stride=1,
+                                  generate_plots=True):
+        """
+        Analyze one interview video against the calibration data of several
+        candidates. Frames are decoded and gaze is estimated once; only the
+        mapping to screen coordinates is done per calibration. Returns one
+        analysis report per candidate (None where the analysis failed).
+        Set generate_plots=False to skip the summary plots
+        """
+        if output_names is None:
+            output_names = [None] * len(candidate_ids)
+        
+        targets = [self._setup_target(video_path, candidate_id, output_name)
+                   for candidate_id, output_name in zip(candidate_ids, output_names)]
+        active = [target for target in targets if target is not None]
+        if not active:
+            return [None] * len(candidate_ids)
+        
+        # Process video
+        cap = self._open_video(video_path)
+        if not cap.isOpened():
+            print(f"❌ Error: Could not open video {video_path}")
+            return [None] * len(candidate_ids)
+        
+        # Get video properties
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        duration = total_frames / fps if fps > 0 else 0
+        if sample_stride is None:
+            sample_stride = max(1, int(round(fps / 15)))
+        
+        print(f"Video properties: {width}x{height}, {fps:.1f} fps, {total_frames} frames ({duration:.1f}s)")
+        
+        # Process frames into preallocated per-column arrays, one set per calibration
+        expected_samples = -(-total_frames // sample_stride)
+        for target in active:
+            target['columns'] = self._allocate_columns(max(expected_samples, self.batch_size))
+            results_path = (target['output_dir']
+                            / f"{target['output_name']}_gaze_analysis.{self.output_format}")
+            if self.output_format == 'parquet':
+                target['results_writer'] = ParquetChunkWriter(results_path)
+            else:
+                target['results_writer'] = CsvChunkWriter(results_path)
+        frame_count = 0
+        detected_count = 0
+        
+        print("Processing frames...")
+        self.gaze_model.reset_face_cache()
+        batch = []
+        flushed = 0
+        reader = FrameReader(cap, stride=sample_stride).start()
+        try:
+            while True:
+                ret, frame = reader.read()
+                if ret:
+                    frame_count += 1
+                    frame_number = (frame_count - 1) * sample_stride + 1
+                    timestamp = frame_number / fps if fps > 0 else frame_number
+                    batch.append((frame_count, frame_number, timestamp, frame))
+                    
+                    # CAP_PROP_FRAME_COUNT is only an estimate for some containers
+                    capacity = len(active[0]['columns']['frame_number'])
+                    if frame_count > capacity:
+                        for target in active:
+                            target['columns'] = self._grow_columns(target['columns'], 2 * capacity)
+                    
+                    if len(batch) < self.batch_size:
+                        continue
+                
+                # Run gaze estimation for the whole batch in one forward pass
+                if batch:
+                    eye_infos = self.gaze_model.get_gaze_batch([item[3] for item in batch])
+                    for (row, frame_number, timestamp, _), eye_info in zip(batch, eye_infos):
+                        if eye_info is not None:
+                            detected_count += 1
+                        for target in active:
+                            self._write_frame(target['columns'], row - 1, frame_number, timestamp,
+                                              eye_info)
+                        
+                        # Progress indicator
+                        if row % 100 == 0:
+                            progress = (frame_number / total_frames) * 100
+                            print(f"Progress: {progress:.1f}% ({frame_number}/{total_frames})")
+                    
+                    # Map the whole batch to screen coordinates and zones at once
+                    start, stop = batch[0][0] - 1, batch[-1][0]
+                    for target in active:
+                        self._map_gaze_to_screen(target['columns'], start, stop,
+                                                 target['homtrans'], target['screen_info'])
+                        self._classify_gaze_zones(target['columns'], start, stop, target['screen_info'])
+                    
+                    # Append completed rows to the CSV every csv_chunk_size frames
+                    processed = batch[-1][0]
+                    if processed - flushed >= self.csv_chunk_size:
+                        for target in active:
+                            target['results_writer'].write(
+                                self._columns_to_frame(target['columns'], flushed, processed))
+                        flushed = processed
+                    batch = []
+                
+                if not ret:
+                    break
+            
+            # Save remaining results
+            if frame_count > flushed or flushed == 0:
+                for target in active:
+                    target['results_writer'].write(
+                        self._columns_to_frame(target['columns'], flushed, frame_count))
+        finally:
+            reader.stop()
+            for target in active:
+                target['results_writer'].close()
+        
+        cap.release()
+        
+        print(f"📈 Detection rate: {detected_count}/{frame_count} ({detected_count/frame_count*100:.1f}%)")
         
-    def analyze_interview_video(self, video_path, candidate_id, output_name=None):
+        return [self._finish_target(target, video_path, frame_count, fps, sample_stride, generate_plots)
+                if target is not None else None for target in targets]
+    
+    def _setup_target(self, video_path, candidate_id, output_name):
         """
-        Analyze an interview video using the candidate's calibration data
+        Load a candidate's calibration and prepare the HomTransform and output
+        directory used to map gaze onto that candidate's screen
         """
         print(f"\n=== Analyzing Interview Video for {candidate_id} ===")
         print(f"Video: {video_path}")
@@ -92,26 +388,6 @@ class InterviewVideoAnalyzer:
         output_dir = self.analysis_dir / output_name
         output_dir.mkdir(exist_ok=True, parents=True)
         
-        # Process video
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            print(f"❌ Error: Could not open video {video_path}")
-            return None
-        
-        # Get video properties
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        duration = total_frames / fps if fps > 0 else 0
-        
-        print(f"Video properties: {width}x{height}, {fps:.1f} fps, {total_frames} frames ({duration:.1f}s)")
-        
-        # Process frames
-        results = []
-        frame_count = 0
-        detected_count = 0
-        
         # Setup HomTransform for coordinate conversion
         homtrans = HomTransform(".")
         homtrans.STransG = transform_matrix
@@ -150,205 +426,188 @@ class InterviewVideoAnalyzer:
             homtrans.StG = []
             homtrans.SetValues = homtrans.CalTargetMM()
         
-        print("Processing frames...")
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            frame_count += 1
-            timestamp = frame_count / fps if fps > 0 else frame_count
-            
-            # Get gaze estimation
-            eye_info = self.gaze_model.get_gaze(frame, imshow=False)
-            
-            if eye_info is not None:
-                detected_count += 1
-                gaze_vector = eye_info['gaze']
-                
-                # Convert to screen coordinates using calibration
-                try:
-                    screen_coords_mm = self._gaze_to_screen_coords(gaze_vector, homtrans)
-                    screen_coords_px = self._mm_to_pixels(screen_coords_mm, screen_info)
-                    
-                    # Determine screen zones
-                    zones = self._classify_gaze_zones(screen_coords_px, screen_info)
-                    
-                    row = {
-                        'frame_number': frame_count,
-                        'timestamp': timestamp,
-                        'gaze_x': float(gaze_vector[0]),
-                        'gaze_y': float(gaze_vector[1]),
-                        'gaze_z': float(gaze_vector[2]),
-                        'screen_x_mm': float(screen_coords_mm[0]),
-                        'screen_y_mm': float(screen_coords_mm[1]),
-                        'screen_x_px': float(screen_coords_px[0]),
-                        'screen_y_px': float(screen_coords_px[1]),
-                        'yaw': float(eye_info['HeadPosAnglesYPR'][0]),
-                        'pitch': float(eye_info['HeadPosAnglesYPR'][1]),
-                        'roll': float(eye_info['HeadPosAnglesYPR'][2]),
-                        'zone_horizontal': zones['horizontal'],
-                        'zone_vertical': zones['vertical'],
-                        'on_screen': zones['on_screen'],
-                        'detected': True
-                    }
-                except Exception as e:
-                    # Fallback if coordinate conversion fails
-                    row = {
-                        'frame_number': frame_count,
-                        'timestamp': timestamp,
-                        'gaze_x': float(gaze_vector[0]),
-                        'gaze_y': float(gaze_vector[1]),
-                        'gaze_z': float(gaze_vector[2]),
-                        'screen_x_mm': np.nan,
-                        'screen_y_mm': np.nan,
-                        'screen_x_px': np.nan,
-                        'screen_y_px': np.nan,
-                        'yaw': float(eye_info['HeadPosAnglesYPR'][0]),
-                        'pitch': float(eye_info['HeadPosAnglesYPR'][1]),
-                        'roll': float(eye_info['HeadPosAnglesYPR'][2]),
-                        'zone_horizontal': 'unknown',
-                        'zone_vertical': 'unknown',
-                        'on_screen': False,
-                        'detected': True
-                    }
-            else:
-                # No face detected
-                row = {
-                    'frame_number': frame_count,
-                    'timestamp': timestamp,
-                    'gaze_x': np.nan,
-                    'gaze_y': np.nan,
-                    'gaze_z': np.nan,
-                    'screen_x_mm': np.nan,
-                    'screen_y_mm': np.nan,
-                    'screen_x_px': np.nan,
-                    'screen_y_px': np.nan,
-                    'yaw': np.nan,
-                    'pitch': np.nan,
-                    'roll': np.nan,
-                    'zone_horizontal': 'no_face',
-                    'zone_vertical': 'no_face',
-                    'on_screen': False,
-                    'detected': False
-                }
-            
-            results.append(row)
-            
-            # Progress indicator
-            if frame_count % 100 == 0:
-                progress = (frame_count / total_frames) * 100
-                print(f"Progress: {progress:.1f}% ({frame_count}/{total_frames})")
-        
-        cap.release()
-        
-        # Save results
-        df = pd.DataFrame(results)
-        csv_path = output_dir / f"{output_name}_gaze_analysis.csv"
-        df.to_csv(csv_path, index=False)
+        return {
+            'candidate_id': candidate_id,
+            'output_name': output_name,
+            'output_dir': output_dir,
+            'screen_info': screen_info,
+            'homtrans': homtrans
+        }
+    
+    def _finish_target(self, target, video_path, frame_count, fps, sample_stride, generate_plots=True):
+        """
+        Build the report and plots for one calibration from its column arrays
+        """
+        output_dir = target['output_dir']
+        output_name = target['output_name']
+        df = self._columns_to_frame(target['columns'], 0, frame_count)
         
         # Generate analysis report
-        analysis_report = self._generate_analysis_report(df, candidate_id, video_path, screen_info)
+        analysis_report = self._generate_analysis_report(df, target['candidate_id'], video_path,
+                                                         target['screen_info'], fps, sample_stride)
         
         # Save report
         report_path = output_dir / f"{output_name}_analysis_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(self._to_json_serializable(analysis_report), f, indent=2)
+        self._write_json(report_path, self._to_json_serializable(analysis_report))
         
         # Generate visualizations
-        self._generate_visualizations(df, output_dir, output_name, screen_info)
+        if generate_plots:
+            self._generate_visualizations(df, output_dir, output_name, target['screen_info'])
         
-        print(f"\n✅ Analysis completed!")
+        print(f"\n✅ Analysis completed for {target['candidate_id']}!")
         print(f"📊 Results saved to: {output_dir}")
-        print(f"📈 Detection rate: {detected_count}/{frame_count} ({detected_count/frame_count*100:.1f}%)")
         
         return analysis_report
     
+    def _allocate_columns(self, n):
+        """
+        Preallocate one typed array per output column; the defaults describe
+        a frame in which no face was detected
+        """
+        columns = {
+            'frame_number': np.zeros(n, dtype=np.int32),
+            'timestamp': np.zeros(n, dtype=np.float64)
+        }
+        for name in FLOAT_COLUMNS:
+            columns[name] = np.full(n, np.nan, dtype=np.float32)
+        for name in ZONE_CATEGORIES:
+            columns[name] = np.zeros(n, dtype=np.int8)
+        columns['on_screen'] = np.zeros(n, dtype=bool)
+        columns['detected'] = np.zeros(n, dtype=bool)
+        return columns
+    
+    def _grow_columns(self, columns, n):
+        """
+        Reallocate the column arrays with capacity n, keeping written rows
+        """
+        grown = self._allocate_columns(n)
+        for name, values in columns.items():
+            grown[name][:len(values)] = values
+        return grown
+    
+    def _write_frame(self, columns, i, frame_number, timestamp, eye_info):
+        """
+        Write the gaze estimation result of one frame into row i of the columns
+        """
+        columns['frame_number'][i] = frame_number
+        columns['timestamp'][i] = timestamp
+        if eye_info is None:
+            # No face detected, keep the defaults
+            return
+        
+        gaze_vector = eye_info['gaze']
+        head_pose = eye_info['HeadPosAnglesYPR']
+        columns['gaze_x'][i] = gaze_vector[0]
+        columns['gaze_y'][i] = gaze_vector[1]
+        columns['gaze_z'][i] = gaze_vector[2]
+        columns['yaw'][i] = head_pose[0]
+        columns['pitch'][i] = head_pose[1]
+        columns['roll'][i] = head_pose[2]
+        columns['detected'][i] = True
+    
+    def _columns_to_frame(self, columns, start, stop):
+        """
+        Build a DataFrame from rows [start, stop) of the column arrays, with
+        the zone columns as categoricals
+        """
+        data = {}
+        for name, values in columns.items():
+            if name in ZONE_CATEGORIES:
+                data[name] = pd.Categorical.from_codes(values[start:stop], ZONE_CATEGORIES[name])
+            else:
+                data[name] = values[start:stop]
+        return pd.DataFrame(data)
+    
+    def _write_json(self, path, data):
+        """
+        Write JSON-serializable data indented, using orjson when available
+        """
+        if orjson is None:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+            return
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    
     def _to_json_serializable(self, obj):
         """Convert numpy/pandas types to JSON-serializable types"""
-        if pd.isna(obj):
-            return None
-        elif isinstance(obj, np.bool_):
-            return bool(obj)
-        elif isinstance(obj, (np.integer, np.int64, np.int32, np.int16, np.int8)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64, np.float32, np.float16)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, dict):
+        # Containers first: pd.isna on a list or array is element-wise
+        if isinstance(obj, dict):
             return {str(k): self._to_json_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
+        elif isinstance(obj, (list, tuple)):
             return [self._to_json_serializable(item) for item in obj]
+        elif isinstance(obj, np.ndarray):
+            return self._to_json_serializable(obj.tolist())
         elif isinstance(obj, pd.Series):
             return self._to_json_serializable(obj.to_dict())
+        elif pd.isna(obj):
+            return None
+        elif isinstance(obj, np.generic):
+            return obj.item()
         return obj
     
-    def _gaze_to_screen_coords(self, gaze_vector, homtrans):
-        """
-        Convert gaze vector to screen coordinates using calibration
-        """
-        # Use the same method as in HomTransform._getGazeOnScreen
-        FSgaze, Sgaze, Sgaze2 = homtrans._getGazeOnScreen(gaze_vector)
-        # Ensure we return scalar values, not arrays
-        if isinstance(Sgaze, np.ndarray) and Sgaze.size > 2:
-            # If Sgaze has more than 2 elements, take first 2
-            return [float(Sgaze.flat[0]), float(Sgaze.flat[1])]
-        else:
-            return [float(Sgaze[0]), float(Sgaze[1])]
-    
-    def _mm_to_pixels(self, coords_mm, screen_info):
+    def _map_gaze_to_screen(self, columns, start, stop, homtrans, screen_info):
         """
-        Convert mm coordinates to pixel coordinates
+        Convert the gaze vectors of rows [start, stop) to screen coordinates
+        using calibration, in one pass. Same as the overall regression
+        estimate of HomTransform._getGazeOnScreen
         """
-        x_mm, y_mm = coords_mm
+        rows = columns['detected'][start:stop]
+        gaze = np.stack([columns[name][start:stop][rows] for name in ('gaze_x', 'gaze_y', 'gaze_z')],
+                        axis=1).astype(np.float64)
+        try:
+            STransG = np.asarray(homtrans.STransG, dtype=np.float64)
+            # Scale each gaze ray onto the screen plane, as HomTransform._getScale
+            SRotG, StG = STransG[:3, :3], STransG[:3, 3]
+            GtS = -SRotG.T @ StG
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scaled = gaze * (GtS[2] / gaze[:, 2:3])
+            screen_mm = scaled @ SRotG.T + StG
+        except Exception:
+            # Fallback if coordinate conversion fails
+            columns['zone_horizontal'][start:stop][rows] = ZONE_CODES['zone_horizontal']['unknown']
+            columns['zone_vertical'][start:stop][rows] = ZONE_CODES['zone_vertical']['unknown']
+            return
         
         # Convert to pixels based on screen dimensions
-        x_px = float(x_mm / screen_info['screen_width_mm']) * screen_info['screen_width_px']
-        y_px = float(y_mm / screen_info['screen_height_mm']) * screen_info['screen_height_px']
-        
-        return [x_px, y_px]
+        x_mm, y_mm = screen_mm[:, 0], screen_mm[:, 1]
+        columns['screen_x_mm'][start:stop][rows] = x_mm
+        columns['screen_y_mm'][start:stop][rows] = y_mm
+        columns['screen_x_px'][start:stop][rows] = (x_mm / screen_info['screen_width_mm']
+                                                    * screen_info['screen_width_px'])
+        columns['screen_y_px'][start:stop][rows] = (y_mm / screen_info['screen_height_mm']
+                                                    * screen_info['screen_height_px'])
     
-    def _classify_gaze_zones(self, coords_px, screen_info):
+    def _classify_gaze_zones(self, columns, start, stop, screen_info):
         """
-        Classify gaze into screen zones for cheating detection
+        Classify rows [start, stop) into screen zones for cheating detection.
+        Frames without a face or with a failed conversion keep their zones
         """
-        x_px, y_px = coords_px
         width = screen_info['screen_width_px']
         height = screen_info['screen_height_px']
         
-        # Check if on screen
-        on_screen = (0 <= x_px <= width) and (0 <= y_px <= height)
-        
-        # Horizontal zones
-        if x_px < width * 0.33:
-            h_zone = 'left'
-        elif x_px < width * 0.67:
-            h_zone = 'center'
-        else:
-            h_zone = 'right'
+        h_codes = columns['zone_horizontal'][start:stop]
+        v_codes = columns['zone_vertical'][start:stop]
+        rows = columns['detected'][start:stop] & (h_codes != ZONE_CODES['zone_horizontal']['unknown'])
+        x_px = columns['screen_x_px'][start:stop][rows]
+        y_px = columns['screen_y_px'][start:stop][rows]
         
-        # Vertical zones
-        if y_px < height * 0.33:
-            v_zone = 'top'
-        elif y_px < height * 0.67:
-            v_zone = 'middle'
-        else:
-            v_zone = 'bottom'
+        # Check if on screen
+        columns['on_screen'][start:stop][rows] = (0 <= x_px) & (x_px <= width) & (0 <= y_px) & (y_px <= height)
         
-        return {
-            'horizontal': h_zone,
-            'vertical': v_zone,
-            'on_screen': on_screen
-        }
+        # Thirds of the screen: left/center/right and top/middle/bottom
+        h_codes[rows] = (ZONE_CODES['zone_horizontal']['left']
+                         + np.digitize(x_px, [width * 0.33, width * 0.67]))
+        v_codes[rows] = (ZONE_CODES['zone_vertical']['top']
+                         + np.digitize(y_px, [height * 0.33, height * 0.67]))
     
-    def _generate_analysis_report(self, df, candidate_id, video_path, screen_info):
+    def _generate_analysis_report(self, df, candidate_id, video_path, screen_info, fps=30.0,
+                                  sample_stride=1):
         """
         Generate comprehensive analysis report
         """
         total_frames = len(df)
-        detected_frames = df['detected'].sum()
-        on_screen_frames = df['on_screen'].sum()
+        detected_frames = np.count_nonzero(df['detected'].to_numpy())
+        on_screen_frames = np.count_nonzero(df['on_screen'].to_numpy())
         
         # Time analysis
         total_duration = df['timestamp'].max() if not df['timestamp'].empty else 0
@@ -356,10 +615,13 @@ class InterviewVideoAnalyzer:
         on_screen_rate = (on_screen_frames / detected_frames) * 100 if detected_frames > 0 else 0
         
         # Zone analysis
-        zone_counts = df[df['detected']].groupby(['zone_horizontal', 'zone_vertical']).size()
+        zone_counts = self._zone_counts(df[df['detected']])
+        
+        # Mean and std of the screen coordinates in one reduction
+        screen_stats = df[['screen_x_px', 'screen_y_px']].agg(['mean', 'std'])
         
         # Suspicious behavior detection
-        suspicious_indicators = self._detect_suspicious_behavior(df)
+        suspicious_indicators = self._detect_suspicious_behavior(df, fps, sample_stride)
         
         report = {
             'candidate_id': candidate_id,
@@ -368,7 +630,8 @@ class InterviewVideoAnalyzer:
             'video_stats': {
                 'total_frames': total_frames,
                 'total_duration_seconds': total_duration,
-                'fps': total_frames / total_duration if total_duration > 0 else 0
+                'fps': total_frames / total_duration if total_duration > 0 else 0,
+                'sample_stride': sample_stride
             },
             'detection_stats': {
                 'detected_frames': detected_frames,
@@ -378,10 +641,10 @@ class InterviewVideoAnalyzer:
             },
             'gaze_distribution': {
                 'zone_counts': zone_counts.to_dict() if not zone_counts.empty else {},
-                'avg_screen_x': df['screen_x_px'].mean(),
-                'avg_screen_y': df['screen_y_px'].mean(),
-                'gaze_std_x': df['screen_x_px'].std(),
-                'gaze_std_y': df['screen_y_px'].std()
+                'avg_screen_x': screen_stats.at['mean', 'screen_x_px'],
+                'avg_screen_y': screen_stats.at['mean', 'screen_y_px'],
+                'gaze_std_x': screen_stats.at['std', 'screen_x_px'],
+                'gaze_std_y': screen_stats.at['std', 'screen_y_px']
             },
             'suspicious_behavior': suspicious_indicators,
             'screen_info': screen_info
@@ -389,11 +652,12 @@ class InterviewVideoAnalyzer:
         
         return report
     
-    def _detect_suspicious_behavior(self, df):
+    def _detect_suspicious_behavior(self, df, fps=30.0, sample_stride=1):
         """
-        Detect patterns that might indicate cheating
+        Detect patterns that might indicate cheating. fps and sample_stride
+        convert time thresholds into a number of analyzed frames
         """
-        detected_df = df[df['detected']].copy()
+        detected_df = df[df['detected']]
         
         indicators = {
             'high_off_screen_rate': False,
@@ -405,47 +669,78 @@ class InterviewVideoAnalyzer:
         if len(detected_df) == 0:
             return indicators
         
+        on_screen = detected_df['on_screen'].to_numpy(dtype=bool)
+        
         # 1. High off-screen rate
-        off_screen_rate = (len(detected_df) - detected_df['on_screen'].sum()) / len(detected_df)
+        off_screen_rate = (len(on_screen) - np.count_nonzero(on_screen)) / len(on_screen)
         indicators['high_off_screen_rate'] = off_screen_rate > 0.3  # >30% off screen
         
         # 2. Excessive horizontal movement
-        left_right_changes = (detected_df['zone_horizontal'].shift() != detected_df['zone_horizontal']).sum()
+        left_right_changes = self._zone_change_count(detected_df['zone_horizontal'])
         indicators['excessive_left_right_movement'] = left_right_changes > len(detected_df) * 0.2
         
         # 3. Prolonged look away periods
         # Find consecutive off-screen sequences
-        off_screen_sequences = []
-        current_seq = 0
-        for on_screen in detected_df['on_screen']:
-            if not on_screen:
-                current_seq += 1
-            else:
-                if current_seq > 0:
-                    off_screen_sequences.append(current_seq)
-                current_seq = 0
+        off_screen_sequences = self._run_lengths(~on_screen)
         
-        # Check for sequences longer than 3 seconds (assuming 30fps)
-        long_sequences = [seq for seq in off_screen_sequences if seq > 90]  # 3 seconds at 30fps
+        # Check for sequences longer than 3 seconds of video
+        samples_per_second = (fps if fps > 0 else 30.0) / sample_stride
+        long_sequences = off_screen_sequences[off_screen_sequences > 3.0 * samples_per_second]
         indicators['prolonged_look_away'] = len(long_sequences) > 0
         
         # 4. Frequent zone changes
-        zone_changes = (detected_df['zone_horizontal'].shift() != detected_df['zone_horizontal']).sum()
-        zone_changes += (detected_df['zone_vertical'].shift() != detected_df['zone_vertical']).sum()
+        zone_changes = left_right_changes + self._zone_change_count(detected_df['zone_vertical'])
         indicators['frequent_zone_changes'] = zone_changes > len(detected_df) * 0.15
         
         return indicators
     
+    def _zone_counts(self, df):
+        """
+        Frame counts per observed (horizontal, vertical) zone pair, from one
+        bincount over the combined category codes
+        """
+        h_labels = ZONE_CATEGORIES['zone_horizontal']
+        v_labels = ZONE_CATEGORIES['zone_vertical']
+        codes = (df['zone_horizontal'].cat.codes.to_numpy(dtype=np.intp) * len(v_labels)
+                 + df['zone_vertical'].cat.codes.to_numpy(dtype=np.intp))
+        counts = np.bincount(codes, minlength=len(h_labels) * len(v_labels))
+        
+        observed = np.flatnonzero(counts)
+        index = pd.MultiIndex.from_arrays(
+            [[h_labels[code] for code in observed // len(v_labels)],
+             [v_labels[code] for code in observed % len(v_labels)]],
+            names=['zone_horizontal', 'zone_vertical']
+        )
+        return pd.Series(counts[observed], index=index)
+    
+    def _zone_change_count(self, zones):
+        """
+        Number of frame-to-frame changes in a categorical zone column,
+        compared on the integer category codes
+        """
+        codes = zones.cat.codes.to_numpy()
+        return int(np.count_nonzero(codes[1:] != codes[:-1]))
+    
+    def _run_lengths(self, mask):
+        """
+        Lengths of the runs of consecutive True values in a boolean array
+        """
+        edges = np.flatnonzero(np.diff(np.r_[False, mask, False].astype(np.int8)))
+        return edges[1::2] - edges[::2]
+    
     def _generate_visualizations(self, df, output_dir, output_name, screen_info):
         """
         Generate visualization plots for gaze analysis
         """
-        detected_df = df[df['detected']].copy()
+        detected_df = df[df['detected']]
         
         if len(detected_df) == 0:
             print("No detected gaze data for visualization")
             return
         
+        # Imported on first use, plotting is the only consumer
+        import matplotlib.pyplot as plt
+        
         # Create subplots
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle(f'Gaze Analysis: {output_name}', fontsize=16)
@@ -465,7 +760,7 @@ class InterviewVideoAnalyzer:
         
         # 2. Zone distribution
         ax2 = axes[0, 1]
-        zone_counts = detected_df.groupby(['zone_horizontal', 'zone_vertical']).size()
+        zone_counts = self._zone_counts(detected_df)
         if not zone_counts.empty:
             zone_counts.plot(kind='bar', ax=ax2)
             ax2.set_title('Gaze Distribution by Screen Zones')
@@ -493,15 +788,88 @@ class InterviewVideoAnalyzer:
         ax4.legend()
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save plot
         plot_path = output_dir / f"{output_name}_analysis_plots.png"
-        plt.savefig(plot_path, dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.savefig(plot_path, dpi=100, bbox_inches='tight')
+        plt.close(fig)
         
         print(f"📈 Visualizations saved to: {plot_path}")
 
+# Analyzer owned by the current worker process of analyze_interview_videos
+_worker_analyzer = None
+
+def _init_worker(gpu_queue, num_threads, output_format):
+    """
+    Process pool initializer: pin the worker to one GPU and its share of the
+    CPU threads, and build its analyzer (and gaze model) once for all the
+    videos it processes
+    """
+    global _worker_analyzer
+    # Workers only save figures; a GUI backend in a child process can hang or crash
+    import matplotlib
+    matplotlib.use('Agg')
+    
+    # Each library would otherwise size its thread pool to every core
+    for var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ[var] = str(num_threads)
+    cv2.setNumThreads(num_threads)
+    torch.set_num_threads(num_threads)
+    
+    gpu_id = gpu_queue.get()
+    if gpu_id is not None:
+        # Must be set before CUDA is initialized in this process
+        os.environ['CUDA_VISIBLE_DEVICES'] = str(gpu_id)
+    _worker_analyzer = InterviewVideoAnalyzer(output_format=output_format)
+
+def _analyze_in_worker(video_path, candidate_id, output_name, sample_stride, generate_plots):
+    return _worker_analyzer.analyze_interview_video(video_path, candidate_id, output_name,
+                                                    sample_stride, generate_plots)
+
+def analyze_interview_videos(video_paths, candidate_id, max_workers=None, sample_stride=1,
+                             generate_plots=False, output_format='csv'):
+    """
+    Analyze several interview videos of a candidate in parallel worker
+    processes, one per GPU by default. Plots are skipped unless
+    generate_plots is set. Returns {video_path: analysis_report}
+    """
+    video_paths = list(video_paths)
+    if not video_paths:
+        return {}
+    
+    n_gpus = torch.cuda.device_count()
+    if max_workers is None:
+        max_workers = max(n_gpus, 1)
+    max_workers = min(max_workers, len(video_paths))
+    
+    # Hand out GPUs round-robin; None leaves device selection to the config
+    ctx = multiprocessing.get_context('spawn')
+    gpu_queue = ctx.Queue()
+    for worker in range(max_workers):
+        gpu_queue.put(worker % n_gpus if n_gpus > 0 else None)
+    
+    # Split the cores between the workers to avoid oversubscription
+    threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+    
+    reports = {}
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(gpu_queue, threads_per_worker, output_format)) as executor:
+        futures = {
+            executor.submit(_analyze_in_worker, video_path, candidate_id, None, sample_stride,
+                            generate_plots): video_path
+            for video_path in video_paths
+        }
+        for future in as_completed(futures):
+            video_path = futures[future]
+            try:
+                reports[video_path] = future.result()
+            except Exception as e:
+                print(f"❌ Error analyzing {video_path}: {e}")
+                reports[video_path] = None
+    
+    return reports
+
 def main():
     """
     Main function for video analysis
@@ -510,10 +878,11 @@ def main():
     
     print("Interview Video Analyzer")
     print("1. Analyze video")
-    print("2. List available candidates")
-    print("3. Exit")
+    print("2. Analyze multiple videos")
+    print("3. List available candidates")
+    print("4. Exit")
     
-    choice = input("Enter choice (1-3): ").strip()
+    choice = input("Enter choice (1-4): ").strip()
     
     if choice == "1":
         candidate_id = input("Enter candidate ID: ").strip()
@@ -525,6 +894,17 @@ def main():
             print("Invalid input")
     
     elif choice == "2":
+        candidate_id = input("Enter candidate ID: ").strip()
+        video_paths = [p.strip() for p in input("Enter video paths (comma separated): ").split(',') if p.strip()]
+        
+        if candidate_id and video_paths:
+            reports = analyze_interview_videos(video_paths, candidate_id)
+            completed = sum(report is not None for report in reports.values())
+            print(f"\n✅ Analyzed {completed}/{len(video_paths)} videos")
+        else:
+            print("Invalid input")
+    
+    elif choice == "3":
         candidates = analyzer.calib_system.list_candidates()
         if candidates:
             print("Available candidates:")
@@ -533,7 +913,7 @@ def main():
         else:
             print("No candidates found")
     
-    elif choice == "3":
+    elif choice == "4":
         print("Goodbye!")
     
     else:
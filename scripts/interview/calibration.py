@@ -6,60 +6,104 @@ This system collects screen dimensions and calibration data for interview candid
 to enable gaze tracking analysis on recorded videos.
 """
 
+import os
 import pathlib
 import cv2
 import numpy as np
 import pandas as pd
 import json
 import datetime
+import copy
+import functools
 import sys
 from omegaconf import OmegaConf
 import screeninfo
 
-# Add project paths
+# Add project paths once; analyzer and calibration both run this on import
 project_root = pathlib.Path(__file__).parent.parent.parent
-sys.path.append(str(project_root / 'src'))
-sys.path.append(str(project_root))
+for path in map(str, (project_root / 'src', project_root)):
+    if path not in sys.path:
+        sys.path.append(path)
 
 from src.plgaze.model_pl_gaze import GazeModel
 from src.gaze_tracking.homtransform import HomTransform
 from utils.platform_utils import get_platform_manager
 
+DEFAULT_CONFIG_PATH = project_root / 'src' / 'plgaze/data/configs/eth-xgaze.yaml'
+
+@functools.lru_cache(maxsize=None)
+def _load_base_config(config_path):
+    """Parse a gaze config and apply platform optimizations, once per path"""
+    config = OmegaConf.load(config_path)
+    config.PACKAGE_ROOT = (project_root / 'src').as_posix()
+    
+    platform_manager = get_platform_manager()
+    if platform_manager.is_mac_silicon:
+        # Mac Silicon optimizations
+        if hasattr(config, 'device'):
+            config.device = 'mps'
+    elif platform_manager.system == 'windows':
+        # Windows optimizations
+        if hasattr(config, 'num_workers'):
+            config.num_workers = min(config.get('num_workers', 4), 2)
+    return config
+
+def load_gaze_config(config_path=None):
+    """
+    Return a platform-optimized gaze estimation config. The YAML is parsed
+    once per process; each caller gets its own copy to modify
+    """
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+    return copy.deepcopy(_load_base_config(str(config_path)))
+
 class InterviewCalibrationSystem:
     """
     System to collect calibration data for interview candidates
     """
     
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, gaze_model=None):
         # Get platform manager
         self.platform_manager = get_platform_manager()
         
-        # Load gaze estimation config
-        if config_path is None:
-            project_root = pathlib.Path(__file__).parent.parent.parent
-            package_root = project_root / 'src'
-            config_path = package_root / 'plgaze/data/configs/eth-xgaze.yaml'
+        # Load gaze estimation config with platform-specific optimizations
+        self.config = load_gaze_config(config_path)
         
-        self.config = OmegaConf.load(config_path)
-        self.config.PACKAGE_ROOT = (project_root / 'src').as_posix()
+        # Gaze model is loaded on first calibration and reused across candidates
+        self._gaze_model = gaze_model
         
-        # Platform-specific optimizations
-        self._optimize_config_for_platform()
+        # Parsed screen_info files, keyed by path: (mtime_ns, screen_info)
+        self._screen_info_cache = {}
         
         # Results directory
         self.calibration_dir = pathlib.Path("results/interview_calibrations")
         self.calibration_dir.mkdir(exist_ok=True, parents=True)
     
-    def _optimize_config_for_platform(self):
-        """Optimize config for current platform"""
-        if self.platform_manager.is_mac_silicon:
-            # Mac Silicon optimizations
-            if hasattr(self.config, 'device'):
-                self.config.device = 'mps'
-        elif self.platform_manager.system == 'windows':
-            # Windows optimizations
-            if hasattr(self.config, 'num_workers'):
-                self.config.num_workers = min(self.config.get('num_workers', 4), 2)
+    @property
+    def gaze_model(self):
+        """Shared GazeModel, loaded once per calibration system"""
+        if self._gaze_model is None:
+            self._gaze_model = GazeModel(self.config)
+        return self._gaze_model
+    
+    def _load_screen_info(self, info_path):
+        """
+        Read a screen_info JSON file, reusing the parsed copy while the file
+        is unchanged on disk
+        """
+        mtime = info_path.stat().st_mtime_ns
+        cached = self._screen_info_cache.get(info_path)
+        if cached is None or cached[0] != mtime:
+            with open(info_path, 'r') as f:
+                cached = (mtime, json.load(f))
+            self._screen_info_cache[info_path] = cached
+        return dict(cached[1])
+    
+    def _save_screen_info(self, info_path, screen_info):
+        """Write a screen_info JSON file and keep the cache in step"""
+        with open(info_path, 'w') as f:
+            json.dump(screen_info, f, indent=2)
+        self._screen_info_cache[info_path] = (info_path.stat().st_mtime_ns, dict(screen_info))
     
     def _setup_cross_platform_camera(self, camera_source=0):
         """Setup camera with platform-specific backend"""
@@ -82,9 +126,35 @@ class InterviewCalibrationSystem:
             cv2.setWindowProperty(window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
         return window_name
         
+    def _prompt_positive_pair(self, first_prompt, second_prompt, cast=float):
+        """Prompt for two positive numbers until both are valid"""
+        while True:
+            try:
+                first = cast(input(first_prompt))
+                second = cast(input(second_prompt))
+                if first > 0 and second > 0:
+                    return first, second
+                print("Please enter positive numbers")
+            except ValueError:
+                print("Please enter valid numbers")
+    
+    def _prompt_physical_size(self):
+        """Prompt for the physical screen width and height in mm"""
+        print("(You can find this in display settings or measure with a ruler)")
+        return self._prompt_positive_pair("Screen width in mm (e.g., 345): ",
+                                          "Screen height in mm (e.g., 194): ")
+    
+    def _prompt_setup(self):
+        """Prompt for camera position and viewing distance, with defaults"""
+        camera_position = input("Camera position (webcam/external/laptop) [default: laptop]: ").strip()
+        distance_estimate = input("Estimated distance from screen in cm (e.g., 60) [default: 60]: ").strip()
+        return camera_position or "laptop", distance_estimate or "60"
+    
     def collect_screen_info(self, candidate_id, manual_input=True):
         """
-        Collect screen dimension information from candidate
+        Collect screen dimension information from candidate. With
+        manual_input=False nothing is prompted: existing info is reused and
+        detected values or defaults fill the rest, unless no monitor is found
         """
         
         print(f"\n=== Screen Information Collection for Candidate {candidate_id} ===")
@@ -93,22 +163,17 @@ class InterviewCalibrationSystem:
         info_path = self.calibration_dir / f"{candidate_id}_screen_info.json"
         if info_path.exists():
             print(f"Found existing screen info for candidate {candidate_id}")
-            with open(info_path, 'r') as f:
-                existing_info = json.load(f)
+            existing_info = self._load_screen_info(info_path)
             
             print(f"Screen: {existing_info.get('screen_width_px')}x{existing_info.get('screen_height_px')} pixels")
             print(f"Physical: {existing_info.get('screen_width_mm')}x{existing_info.get('screen_height_mm')} mm")
             
+            if not manual_input:
+                return existing_info
             use_existing = input("Use existing screen info? (y/n) [default: y]: ").strip().lower()
             if use_existing != 'n':
                 return existing_info
         
-        screen_info = {
-            'candidate_id': candidate_id,
-            'timestamp': datetime.datetime.now().isoformat(),
-            'collection_method': 'automatic'
-        }
-        
         # Automatically detect screen information
         print("Automatically detecting screen information...")
         try:
@@ -117,10 +182,20 @@ class InterviewCalibrationSystem:
             print(f"Screen detection failed: {e}")
             monitors = []
         
+        extra_info = {}
         if not monitors:
             print("ERROR: No monitors detected! Falling back to manual input.")
-            manual_input = True
+            collection_method = 'manual'
+            
+            print("Manual screen information input:")
+            screen_width, screen_height = self._prompt_positive_pair(
+                "Screen width in pixels (e.g., 1920): ", "Screen height in pixels (e.g., 1080): ", int)
+            
+            print("\nFor accurate gaze mapping, we need physical screen size:")
+            screen_width_mm, screen_height_mm = self._prompt_physical_size()
         else:
+            collection_method = 'automatic'
+            
             # Find primary monitor or use first one
             primary_monitor = None
             for monitor in monitors:
@@ -156,102 +231,49 @@ class InterviewCalibrationSystem:
                 print(f"(Based on {screen_width}x{screen_height} pixels at 96 DPI)")
                 
                 # Ask user to confirm or override
-                use_auto = input("\nUse these automatically calculated dimensions? (y/n) [default: y]: ").strip().lower()
-                if use_auto == 'n':
-                    print("\nPlease provide physical screen size manually:")
-                    print("(You can find this in display settings or measure with a ruler)")
-                    
-                    while True:
-                        try:
-                            screen_width_mm = float(input("Screen width in mm (e.g., 345): "))
-                            screen_height_mm = float(input("Screen height in mm (e.g., 194): "))
-                            if screen_width_mm > 0 and screen_height_mm > 0:
-                                break
-                            else:
-                                print("Please enter positive numbers")
-                        except ValueError:
-                            print("Please enter valid numbers")
+                if manual_input:
+                    use_auto = input("\nUse these automatically calculated dimensions? (y/n) [default: y]: ").strip().lower()
+                    if use_auto == 'n':
+                        print("\nPlease provide physical screen size manually:")
+                        screen_width_mm, screen_height_mm = self._prompt_physical_size()
             else:
                 print(f"Detected physical dimensions: {screen_width_mm:.1f}x{screen_height_mm:.1f} mm")
             
-            # Collect setup information
-            print("\nPlease provide additional setup information:")
-            camera_position = input("Camera position (webcam/external/laptop) [default: laptop]: ").strip()
-            if not camera_position:
-                camera_position = "laptop"
-                
-            distance_estimate = input("Estimated distance from screen in cm (e.g., 60) [default: 60]: ").strip()
-            if not distance_estimate:
-                distance_estimate = "60"
-            
-            # Calculate additional metrics
-            diagonal_mm = (screen_width_mm**2 + screen_height_mm**2)**0.5
-            diagonal_inches = diagonal_mm / 25.4
-            
-            screen_info.update({
-                'screen_width_px': screen_width,
-                'screen_height_px': screen_height,
-                'screen_width_mm': screen_width_mm,
-                'screen_height_mm': screen_height_mm,
-                'camera_position': camera_position,
-                'distance_cm': distance_estimate,
-                'dpi': (screen_width / (screen_width_mm / 25.4)) if screen_width_mm > 0 else None,
+            diagonal_inches = (screen_width_mm**2 + screen_height_mm**2)**0.5 / 25.4
+            extra_info = {
                 'diagonal_inches': diagonal_inches,
                 'monitor_name': getattr(primary_monitor, 'name', 'unknown')
-            })
-            
-            print(f"\nScreen diagonal: {diagonal_inches:.1f} inches")
-            print(f"DPI: {screen_info['dpi']:.1f}")
-            
-            manual_input = False
+            }
         
-        if manual_input:
-            # Fallback to manual input
-            print("Manual screen information input:")
-            while True:
-                try:
-                    screen_width = int(input("Screen width in pixels (e.g., 1920): "))
-                    screen_height = int(input("Screen height in pixels (e.g., 1080): "))
-                    if screen_width > 0 and screen_height > 0:
-                        break
-                    else:
-                        print("Please enter positive numbers")
-                except ValueError:
-                    print("Please enter valid numbers")
-            
-            print("\nFor accurate gaze mapping, we need physical screen size:")
-            print("(You can find this in display settings or measure with a ruler)")
-            
-            while True:
-                try:
-                    screen_width_mm = float(input("Screen width in mm (e.g., 345): "))
-                    screen_height_mm = float(input("Screen height in mm (e.g., 194): "))
-                    if screen_width_mm > 0 and screen_height_mm > 0:
-                        break
-                    else:
-                        print("Please enter positive numbers")
-                except ValueError:
-                    print("Please enter valid numbers")
-            
-            # Collect setup information
-            camera_position = input("Camera position (webcam/external/laptop): ").strip()
-            distance_estimate = input("Estimated distance from screen in cm (e.g., 60): ").strip()
-            
-            screen_info.update({
-                'screen_width_px': screen_width,
-                'screen_height_px': screen_height,
-                'screen_width_mm': screen_width_mm,
-                'screen_height_mm': screen_height_mm,
-                'camera_position': camera_position,
-                'distance_cm': distance_estimate,
-                'dpi': (screen_width / (screen_width_mm / 25.4)) if screen_width_mm > 0 else None,
-                'collection_method': 'manual'
-            })
+        # Collect setup information
+        if manual_input or collection_method == 'manual':
+            print("\nPlease provide additional setup information:")
+            camera_position, distance_estimate = self._prompt_setup()
+        else:
+            camera_position, distance_estimate = "laptop", "60"
+            print(f"\nUsing default setup: camera position {camera_position}, distance {distance_estimate} cm")
+        
+        screen_info = {
+            'candidate_id': candidate_id,
+            'timestamp': datetime.datetime.now().isoformat(),
+            'collection_method': collection_method,
+            'screen_width_px': screen_width,
+            'screen_height_px': screen_height,
+            'screen_width_mm': screen_width_mm,
+            'screen_height_mm': screen_height_mm,
+            'camera_position': camera_position,
+            'distance_cm': distance_estimate,
+            'dpi': screen_width / (screen_width_mm / 25.4),
+            **extra_info
+        }
+        
+        if extra_info:
+            print(f"\nScreen diagonal: {extra_info['diagonal_inches']:.1f} inches")
+        print(f"DPI: {screen_info['dpi']:.1f}")
         
         # Save screen info
         info_path = self.calibration_dir / f"{candidate_id}_screen_info.json"
-        with open(info_path, 'w') as f:
-            json.dump(screen_info, f, indent=2)
+        self._save_screen_info(info_path, screen_info)
         
         print(f"Screen information saved to: {info_path}")
         return screen_info
@@ -268,13 +290,12 @@ class InterviewCalibrationSystem:
         # Load screen info for this candidate
         info_path = self.calibration_dir / f"{candidate_id}_screen_info.json"
         if info_path.exists():
-            with open(info_path, 'r') as f:
-                screen_info = json.load(f)
+            screen_info = self._load_screen_info(info_path)
         else:
             raise RuntimeError(f"No screen info found for candidate {candidate_id}. Please run setup first.")
         
-        # Initialize models
-        model = GazeModel(self.config)
+        # Initialize models; the transform holds per-candidate state
+        model = self.gaze_model
         homtrans = HomTransform(".")
         
         # Override the screen dimensions from collected info
@@ -289,19 +310,27 @@ class InterviewCalibrationSystem:
             raise RuntimeError(f"Could not open camera {camera_source} on {self.platform_manager.system}")
         
         # Wait for user to be ready
+        window_name = self._create_cross_platform_window("Interview Calibration", fullscreen=False)
+        overlay = overlay_mask = None
         while True:
             ret, frame = cap.read()
             if not ret:
+                # Yield to the GUI instead of spinning while the camera warms up
+                cv2.waitKey(10)
                 continue
-                
-            cv2.putText(frame, f"Calibration for {candidate_id}", (50, 50), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-            cv2.putText(frame, "Press 's' to start calibration", (50, 100), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-            cv2.putText(frame, "Press 'q' to quit", (50, 130), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
             
-            window_name = self._create_cross_platform_window("Interview Calibration", fullscreen=False)
+            # Render the instructions once, then copy them onto each frame
+            if overlay is None or overlay.shape != frame.shape:
+                overlay = np.zeros_like(frame)
+                cv2.putText(overlay, f"Calibration for {candidate_id}", (50, 50), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                cv2.putText(overlay, "Press 's' to start calibration", (50, 100), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                cv2.putText(overlay, "Press 'q' to quit", (50, 130), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                overlay_mask = overlay.any(axis=2, keepdims=True)
+            np.copyto(frame, overlay, where=overlay_mask)
+            
             cv2.imshow(window_name, frame)
             
             key = cv2.waitKey(1) & 0xFF
@@ -315,14 +344,8 @@ class InterviewCalibrationSystem:
         # Run calibration
         print("Starting calibration...")
         try:
-            # Test if face detection is working first
-            ret, test_frame = cap.read()
-            if ret:
-                test_eye_info = model.get_gaze(test_frame, imshow=False)
-                if test_eye_info is None or test_eye_info.get('gaze') is None:
-                    raise Exception("Face detection or gaze estimation not working. Please ensure your face is visible to the camera.")
-            
-            STransG = homtrans.calibrate(model, cap, sfm=False)
+            # The first calibration frame doubles as the face detection check
+            STransG = homtrans.calibrate(model, cap, sfm=False, validate_first=True)
             
             # Save calibration data with candidate ID
             calib_data_path = self.calibration_dir / f"{candidate_id}_calibration.csv"
@@ -339,9 +362,11 @@ class InterviewCalibrationSystem:
                 'SetValues': homtrans.SetValues if hasattr(homtrans, 'SetValues') else None
             }
             
-            # Save transformation data
+            # Save transformation data; missing entries are left out, as the
+            # web backend does, so the file loads without pickle
             transform_path = self.calibration_dir / f"{candidate_id}_transform_matrix.npz"
-            np.savez(transform_path, **calib_state)
+            np.savez(transform_path, **{key: np.asarray(value, dtype=np.float64)
+                                        for key, value in calib_state.items() if value is not None})
             
             print(f"Calibration completed successfully!")
             print(f"Calibration data saved to: {calib_data_path}")
@@ -371,8 +396,7 @@ class InterviewCalibrationSystem:
             if not info_path.exists():
                 raise FileNotFoundError(f"No screen info found for candidate {candidate_id}")
         
-        with open(info_path, 'r') as f:
-            screen_info = json.load(f)
+        screen_info = self._load_screen_info(info_path)
         
         # Load transform matrix (try structured directory first)
         transform_path_npz = candidate_dir / f"{candidate_id}_transform_matrix.npz"
@@ -386,12 +410,7 @@ class InterviewCalibrationSystem:
         calib_state = {}
         if transform_path_npz.exists():
             # Load new format with complete state
-            data = np.load(transform_path_npz, allow_pickle=True)
-            calib_state = {
-                'STransG': data['STransG'],
-                'StG': data['StG'] if 'StG' in data else None,
-                'SetValues': data['SetValues'] if 'SetValues' in data else None
-            }
+            calib_state = self._load_calib_state(transform_path_npz)
         elif transform_path_npy.exists():
             # Load old format (just STransG)
             calib_state = {
@@ -418,6 +437,26 @@ class InterviewCalibrationSystem:
             'calib_state': calib_state  # Include full calibration state
         }
     
+    def _load_calib_state(self, transform_path):
+        """
+        Read STransG, StG and SetValues from a transform_matrix.npz file,
+        with None for entries the file does not have
+        """
+        keys = ('STransG', 'StG', 'SetValues')
+        try:
+            with np.load(transform_path, allow_pickle=False) as data:
+                return {key: data[key] if key in data else None for key in keys}
+        except ValueError:
+            pass
+        
+        # Older files stored missing entries as pickled None objects
+        with np.load(transform_path, allow_pickle=True) as data:
+            calib_state = {key: data[key] if key in data else None for key in keys}
+        for key, value in calib_state.items():
+            if value is not None and value.dtype == object and value.ndim == 0:
+                calib_state[key] = value.item()
+        return calib_state
+    
     def setup_candidate(self, candidate_id, camera_source=0):
         """
         Complete setup process for a candidate
@@ -447,12 +486,15 @@ class InterviewCalibrationSystem:
         """
         List all candidates with calibration data
         """
+        # One scandir pass; the suffix test also skips ':Zone.Identifier' streams
+        suffix = "_screen_info.json"
         candidates = set()
-        for file in self.calibration_dir.glob("*_screen_info.json"):
-            candidate_id = file.stem.replace("_screen_info", "")
-            candidates.add(candidate_id)
+        with os.scandir(self.calibration_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    candidates.add(entry.name[:-len(suffix)])
         
-        return sorted(list(candidates))
+        return sorted(candidates)
 
 def main():
     """
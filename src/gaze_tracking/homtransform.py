@@ -128,7 +128,7 @@ class HomTransform:
 
         return
 
-    def calibrate(self, model, cap, sfm=False):
+    def calibrate(self, model, cap, sfm=False, validate_first=False):
         print(f"DEBUG: Starting calibration with screen size: {self.width}x{self.height}")
         print(f"DEBUG: Screen size in mm: {self.width_mm}x{self.height_mm}")
         
@@ -226,7 +226,8 @@ class HomTransform:
             # frame_cam = cv2.undistort(frame_cam, self.camera_matrix, self.dist_coeffs)
             eye_info = model.get_gaze(frame=frame_cam, imshow=False)
             if eye_info is None:
-                print("DEBUG: eye_info is None - no face detected")
+                if validate_first and iteration_count == 1:
+                    raise Exception("Face detection or gaze estimation not working. Please ensure your face is visible to the camera.")
                 raise Exception("No eye info. Eye tracking failed.")
             
             # Debug: check eye_info contents
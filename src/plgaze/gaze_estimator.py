@@ -8,7 +8,7 @@ from omegaconf import DictConfig
 from plgaze.common import Camera, Face, FacePartsName
 from plgaze.head_pose_estimation import HeadPoseNormalizer, LandmarkEstimator
 from plgaze.models import create_model
-from plgaze.transforms import create_transform
+from plgaze.transforms import create_batch_transform, create_transform
 from plgaze.utils import get_3d_face_model
 
 logger = logging.getLogger(__name__)
@@ -32,16 +32,76 @@ class GazeEstimator:
             self._config.gaze_estimator.normalized_camera_distance)
         self._gaze_estimation_model = self._load_model()
         self._transform = create_transform(config)
+        self._batch_transform = None
+        if config.mode in ['MPIIFaceGaze', 'ETH-XGaze']:
+            self._batch_transform = create_batch_transform(config)
+
+        # Pinned host staging buffer and copy stream for batched CUDA uploads
+        self._pinned_images = None
+        self._upload_stream = None
+        if torch.device(config.device).type == 'cuda':
+            self._upload_stream = torch.cuda.Stream()
 
     def _load_model(self) -> torch.nn.Module:
         model = create_model(self._config)
         checkpoint = torch.load(self._config.gaze_estimator.checkpoint,
                                 map_location='cpu')
         model.load_state_dict(checkpoint['model'])
-        model.to(torch.device(self._config.device))
+        device = torch.device(self._config.device)
+        # Half precision engages tensor cores on CUDA; other devices keep FP32
+        use_fp16 = self._config.gaze_estimator.get('fp16', True)
+        self._dtype = (torch.float16 if use_fp16 and device.type == 'cuda'
+                       else torch.float32)
+        model.to(device, dtype=self._dtype, memory_format=torch.channels_last)
+        # Inference only: no autograd state on the weights
         model.eval()
+        model.requires_grad_(False)
+        if self._config.gaze_estimator.get('compile', False):
+            model = self._compile_model(model)
         return model
 
+    def _compile_model(self, model: torch.nn.Module) -> torch.nn.Module:
+        if not hasattr(torch, 'compile'):
+            logger.warning('torch.compile requires PyTorch 2.x, running eager')
+            return model
+        model = torch.compile(model, mode='reduce-overhead', dynamic=False)
+        if self._config.mode != 'MPIIGaze':
+            # Warm up so the first real frame does not pay for compilation
+            height, width = self._config.gaze_estimator.image_size
+            with torch.inference_mode():
+                model(self._to_device(torch.zeros((1, 3, height, width))))
+        return model
+
+    def _to_device(self, images: torch.Tensor) -> torch.Tensor:
+        device = torch.device(self._config.device)
+        return images.to(device, dtype=self._dtype,
+                         memory_format=torch.channels_last,
+                         non_blocking=True)
+
+    def _upload_batch(self, images: torch.Tensor) -> torch.Tensor:
+        """Copy a batch of images to the device.
+
+        On CUDA the batch is staged in reusable page-locked memory and
+        copied asynchronously on a side stream.
+        """
+        if self._upload_stream is None:
+            return self._to_device(images)
+
+        n = len(images)
+        if (self._pinned_images is None
+                or self._pinned_images.shape[0] < n
+                or self._pinned_images.shape[1:] != images.shape[1:]):
+            self._pinned_images = torch.empty(images.shape,
+                                              dtype=images.dtype,
+                                              pin_memory=True)
+        staged = self._pinned_images[:n].copy_(images)
+
+        with torch.cuda.stream(self._upload_stream):
+            batch = self._to_device(staged)
+        torch.cuda.current_stream().wait_stream(self._upload_stream)
+        batch.record_stream(torch.cuda.current_stream())
+        return batch
+
     def detect_faces(self, image: np.ndarray) -> List[Face]:
         return self._landmark_estimator.detect_faces(image)
 
@@ -64,7 +124,28 @@ class GazeEstimator:
         else:
             raise ValueError
 
-    @torch.no_grad()
+    def estimate_gaze_batch(self, images: List[np.ndarray],
+                            faces: List[Face]) -> None:
+        """Estimate gaze for one face per image with a single network call.
+
+        Face-based models (ETH-XGaze, MPIIFaceGaze) stack all normalized
+        face crops into one batch; MPIIGaze falls back to per-face calls.
+        """
+        if self._config.mode == 'MPIIGaze':
+            for image, face in zip(images, faces):
+                self.estimate_gaze(image, face)
+            return
+        if self._config.mode not in ['MPIIFaceGaze', 'ETH-XGaze']:
+            raise ValueError
+
+        for image, face in zip(images, faces):
+            self._face_model3d.estimate_head_pose(face, self.camera)
+            self._face_model3d.compute_3d_pose(face)
+            self._face_model3d.compute_face_eye_centers(face, self._config.mode)
+            self._head_pose_normalizer.normalize(image, face)
+        self._run_face_model_batch(faces)
+
+    @torch.inference_mode()
     def _run_mpiigaze_model(self, face: Face) -> None:
         images = []
         head_poses = []
@@ -83,10 +164,10 @@ class GazeEstimator:
         head_poses = torch.from_numpy(head_poses)
 
         device = torch.device(self._config.device)
-        images = images.to(device)
-        head_poses = head_poses.to(device)
+        images = self._to_device(images)
+        head_poses = head_poses.to(device, dtype=self._dtype)
         predictions = self._gaze_estimation_model(images, head_poses)
-        predictions = predictions.cpu().numpy()
+        predictions = predictions.float().cpu().numpy()
 
         for i, key in enumerate(self.EYE_KEYS):
             eye = getattr(face, key.name.lower())
@@ -96,28 +177,41 @@ class GazeEstimator:
             eye.angle_to_vector()
             eye.denormalize_gaze_vector()
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def _run_mpiifacegaze_model(self, face: Face) -> None:
         image = self._transform(face.normalized_image).unsqueeze(0)
 
-        device = torch.device(self._config.device)
-        image = image.to(device)
+        image = self._to_device(image)
         prediction = self._gaze_estimation_model(image)
-        prediction = prediction.cpu().numpy()
+        prediction = prediction.float().cpu().numpy()
 
         face.normalized_gaze_angles = prediction[0]
         face.angle_to_vector()
         face.denormalize_gaze_vector()
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def _run_ethxgaze_model(self, face: Face) -> None:
         image = self._transform(face.normalized_image).unsqueeze(0)
 
-        device = torch.device(self._config.device)
-        image = image.to(device)
+        image = self._to_device(image)
         prediction = self._gaze_estimation_model(image)
-        prediction = prediction.cpu().numpy()
+        prediction = prediction.float().cpu().numpy()
 
         face.normalized_gaze_angles = prediction[0]
         face.angle_to_vector()
         face.denormalize_gaze_vector()
+
+    @torch.inference_mode()
+    def _run_face_model_batch(self, faces: List[Face]) -> None:
+        if not faces:
+            return
+        images = self._upload_batch(self._batch_transform(
+            [face.normalized_image for face in faces]))
+
+        predictions = self._gaze_estimation_model(images)
+        predictions = predictions.float().cpu().numpy()
+
+        for face, prediction in zip(faces, predictions):
+            face.normalized_gaze_angles = prediction
+            face.angle_to_vector()
+            face.denormalize_gaze_vector()
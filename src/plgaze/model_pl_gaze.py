@@ -34,6 +34,11 @@ class GazeModel:
         self.show_normalized_image = self.config.demo.show_normalized_image
         self.show_template_model = self.config.demo.show_template_model
 
+        # get_gaze_batch reuses the last landmarks while the scene barely
+        # changes (mean absolute difference of a grayscale thumbnail)
+        self.reuse_threshold = self.config.face_detector.get('reuse_threshold', 0.0)
+        self.reset_face_cache()
+
     def get_gaze(self, frame, imshow=False):
 
         undistorted = cv2.undistort(frame, self.gaze_estimator.camera.camera_matrix,
@@ -43,17 +48,7 @@ class GazeModel:
         eye_info = None
         for face in faces:
             self.gaze_estimator.estimate_gaze(undistorted, face)
-            eye_centers = np.array([0,0,0,0])
-            pitch, yaw = np.rad2deg(face.vector_to_angle(face.gaze_vector))
-            head_pose_angles = np.array([yaw, pitch, 0])
-            head_box = (face.bbox).flatten()[:2]
-            right_eye_box = np.array([0,0])
-            left_eye_box = np.array([0,0])
-            R = np.array([[1,0,0],[0,-1,0],[0,0,-1]])
-            gaze_vec = R @ face.gaze_vector
-            eye_info = {'gaze':gaze_vec, 'EyeRLCenterPos':eye_centers, 'HeadPosAnglesYPR':head_pose_angles, 
-                        'HeadPosInFrame':head_box, 'right_eye_box':right_eye_box, 'left_eye_box':left_eye_box, 
-                        'EyeState':np.array([1, 1]) }
+            eye_info = self._get_eye_info(face)
             if imshow:
                 self._draw_gaze_vector(face)
                 self._draw_face_bbox(face)
@@ -61,6 +56,68 @@ class GazeModel:
                     self.visualizer.image = self.visualizer.image[:, ::-1]
             
         return eye_info
+
+    def get_gaze_batch(self, frames):
+        """
+        Batched variant of get_gaze for offline processing (no drawing).
+        Face detection still runs per frame, but the gaze network is called
+        once for all frames. Returns a list of eye_info dicts aligned with
+        frames, None where no face was detected.
+        """
+        images = []
+        faces = []
+        slots = []
+        for i, frame in enumerate(frames):
+            undistorted = cv2.undistort(frame, self.gaze_estimator.camera.camera_matrix,
+                                        self.gaze_estimator.camera.dist_coefficients)
+            detected = self._detect_faces_cached(undistorted)
+            if detected:
+                # get_gaze reports the last detected face, keep the same choice
+                images.append(undistorted)
+                faces.append(detected[-1])
+                slots.append(i)
+
+        self.gaze_estimator.estimate_gaze_batch(images, faces)
+
+        eye_infos = [None] * len(frames)
+        for i, face in zip(slots, faces):
+            eye_infos[i] = self._get_eye_info(face)
+        return eye_infos
+
+    def reset_face_cache(self) -> None:
+        """Forget the cached face, e.g. before starting a new video"""
+        self._last_thumb = None
+        self._last_face = None
+
+    def _detect_faces_cached(self, image: np.ndarray) -> list:
+        if self.reuse_threshold <= 0:
+            return self.gaze_estimator.detect_faces(image)
+
+        thumb = cv2.cvtColor(cv2.resize(image, (160, 90), interpolation=cv2.INTER_AREA),
+                             cv2.COLOR_BGR2GRAY)
+        # Compare against the last detected frame so slow drift still re-detects
+        if (self._last_face is not None
+                and cv2.absdiff(thumb, self._last_thumb).mean() < self.reuse_threshold):
+            bbox, landmarks = self._last_face
+            return [Face(bbox.copy(), landmarks.copy())]
+
+        faces = self.gaze_estimator.detect_faces(image)
+        self._last_thumb = thumb
+        self._last_face = (faces[-1].bbox, faces[-1].landmarks) if faces else None
+        return faces
+
+    def _get_eye_info(self, face: Face) -> dict:
+        eye_centers = np.array([0,0,0,0])
+        pitch, yaw = np.rad2deg(face.vector_to_angle(face.gaze_vector))
+        head_pose_angles = np.array([yaw, pitch, 0])
+        head_box = (face.bbox).flatten()[:2]
+        right_eye_box = np.array([0,0])
+        left_eye_box = np.array([0,0])
+        R = np.array([[1,0,0],[0,-1,0],[0,0,-1]])
+        gaze_vec = R @ face.gaze_vector
+        return {'gaze':gaze_vec, 'EyeRLCenterPos':eye_centers, 'HeadPosAnglesYPR':head_pose_angles, 
+                'HeadPosInFrame':head_box, 'right_eye_box':right_eye_box, 'left_eye_box':left_eye_box, 
+                'EyeState':np.array([1, 1]) }
     
     def _draw_gaze_vector(self, face: Face) -> None:
         length = self.config.demo.gaze_visualization_length
@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+from omegaconf import OmegaConf
+
+from plgaze.transforms import create_batch_transform, create_transform
+
+
+class TestTransforms(unittest.TestCase):
+
+    def test_batch_transform_matches_per_image(self):
+        rng = np.random.default_rng(0)
+        images = [rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+                  for h, w in ((120, 100), (224, 224), (300, 260))]
+        for mode in ('MPIIFaceGaze', 'ETH-XGaze'):
+            config = OmegaConf.create({'mode': mode,
+                                       'gaze_estimator': {'image_size': [224, 224]}})
+            transform = create_transform(config)
+            batch_transform = create_batch_transform(config)
+
+            batch = batch_transform(images).numpy()
+            self.assertEqual(batch.shape, (len(images), 3, 224, 224))
+            self.assertEqual(batch.dtype, np.float32)
+            for i, image in enumerate(images):
+                np.testing.assert_allclose(batch[i], transform(image).numpy(),
+                                           rtol=1e-5, atol=1e-5, err_msg=mode)
+
+    def test_batch_transform_unsupported_mode(self):
+        config = OmegaConf.create({'mode': 'MPIIGaze',
+                                   'gaze_estimator': {'image_size': [224, 224]}})
+        with self.assertRaises(ValueError):
+            create_batch_transform(config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
-from typing import Any
+from typing import Any, Callable, List
 
 import cv2
+import numpy as np
+import torch
 import torchvision.transforms as T
 from omegaconf import DictConfig
 
@@ -37,3 +39,35 @@ def _create_ethxgaze_transform(config: DictConfig) -> Any:
                                                      0.225]),  # RGB
     ])
     return transform
+
+
+def create_batch_transform(
+        config: DictConfig) -> Callable[[List[np.ndarray]], torch.Tensor]:
+    """Vectorized equivalent of create_transform for face-based models.
+
+    Resizes each BGR crop, then converts, normalizes and transposes the
+    whole stack in single NumPy operations, returning an (N, 3, H, W)
+    float32 tensor.
+    """
+    if config.mode == 'MPIIFaceGaze':
+        # MPIIFaceGaze normalizes in BGR order
+        mean, std, to_rgb = [0.406, 0.456, 0.485], [0.225, 0.224, 0.229], False
+    elif config.mode == 'ETH-XGaze':
+        mean, std, to_rgb = [0.485, 0.456, 0.406], [0.229, 0.224, 0.225], True
+    else:
+        raise ValueError
+    size = tuple(config.gaze_estimator.image_size)
+    # Fold ToTensor's 1/255 into the normalization: x * scale - shift
+    scale = 1 / (255 * np.asarray(std, dtype=np.float32))
+    shift = np.asarray(mean, dtype=np.float32) / np.asarray(std,
+                                                             dtype=np.float32)
+
+    def transform(images: List[np.ndarray]) -> torch.Tensor:
+        batch = np.stack([cv2.resize(image, size) for image in images])
+        if to_rgb:
+            batch = batch[..., ::-1]
+        batch = batch * scale - shift
+        return torch.from_numpy(
+            np.ascontiguousarray(batch.transpose(0, 3, 1, 2)))
+
+    return transform
@@ -0,0 +1,160 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from scripts.interview.analyzer import InterviewVideoAnalyzer, ZONE_CATEGORIES, ZONE_CODES
+from src.gaze_tracking.homtransform import HomTransform
+
+
+SCREEN_INFO = {
+    'screen_width_px': 1000,
+    'screen_height_px': 600,
+    'screen_width_mm': 345.0,
+    'screen_height_mm': 207.0
+}
+
+
+def _zone_per_frame(x_px, y_px, width, height):
+    """ Per-frame zone rules the vectorized classification must reproduce """
+    on_screen = 0 <= x_px <= width and 0 <= y_px <= height
+    if x_px < width * 0.33:
+        h_zone = 'left'
+    elif x_px < width * 0.67:
+        h_zone = 'center'
+    else:
+        h_zone = 'right'
+    if y_px < height * 0.33:
+        v_zone = 'top'
+    elif y_px < height * 0.67:
+        v_zone = 'middle'
+    else:
+        v_zone = 'bottom'
+    return on_screen, h_zone, v_zone
+
+
+def _run_lengths_per_frame(mask):
+    """ Run lengths of True values, counting a run that reaches the last frame """
+    runs = []
+    current = 0
+    for value in mask:
+        if value:
+            current += 1
+        else:
+            if current > 0:
+                runs.append(current)
+            current = 0
+    if current > 0:
+        runs.append(current)
+    return runs
+
+
+class TestInterviewAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        # Skip __init__: no camera, model or calibration files are needed here
+        self.analyzer = InterviewVideoAnalyzer.__new__(InterviewVideoAnalyzer)
+        self.rng = np.random.default_rng(0)
+
+    def _homtransform(self):
+        homtrans = HomTransform.__new__(HomTransform)
+        SRotG = np.array([[-1, 0, 0], [0, -1, 0], [0, 0, 1]])
+        StG = np.array([170.0, -40.0, 550.0])
+        homtrans.STransG = np.vstack((np.hstack((SRotG, StG.reshape(3, 1))), np.array([0, 0, 0, 1])))
+        homtrans.StG = [StG + self.rng.normal(0, 10, 3) for _ in range(3)]
+        return homtrans
+
+    def test_map_gaze_to_screen_matches_per_frame(self):
+        n = 50
+        homtrans = self._homtransform()
+        columns = self.analyzer._allocate_columns(n)
+        gaze = np.column_stack((self.rng.uniform(-0.4, 0.4, n),
+                                self.rng.uniform(-0.3, 0.3, n),
+                                self.rng.uniform(-1.0, -0.7, n))).astype(np.float32)
+        columns['gaze_x'][:], columns['gaze_y'][:], columns['gaze_z'][:] = gaze.T
+        columns['detected'][:] = True
+        columns['detected'][::7] = False
+
+        self.analyzer._map_gaze_to_screen(columns, 0, n, homtrans, SCREEN_INFO)
+
+        for i in range(n):
+            if not columns['detected'][i]:
+                self.assertTrue(np.isnan(columns['screen_x_mm'][i]))
+                self.assertEqual(columns['zone_horizontal'][i], ZONE_CODES['zone_horizontal']['no_face'])
+                continue
+            _, Sgaze, _ = homtrans._getGazeOnScreen(gaze[i].astype(np.float64))
+            np.testing.assert_allclose(columns['screen_x_mm'][i], Sgaze[0, 0], rtol=1e-5, atol=1e-3)
+            np.testing.assert_allclose(columns['screen_y_mm'][i], Sgaze[1, 0], rtol=1e-5, atol=1e-3)
+            np.testing.assert_allclose(columns['screen_x_px'][i],
+                                       Sgaze[0, 0] / SCREEN_INFO['screen_width_mm'] * SCREEN_INFO['screen_width_px'],
+                                       rtol=1e-5, atol=1e-3)
+            np.testing.assert_allclose(columns['screen_y_px'][i],
+                                       Sgaze[1, 0] / SCREEN_INFO['screen_height_mm'] * SCREEN_INFO['screen_height_px'],
+                                       rtol=1e-5, atol=1e-3)
+
+    def test_classify_gaze_zones_at_edges(self):
+        width, height = SCREEN_INFO['screen_width_px'], SCREEN_INFO['screen_height_px']
+        x_edges = [-1.0, 0.0, width * 0.33 - 0.01, width * 0.33, width * 0.67 - 0.01, width * 0.67,
+                   width, width + 0.5]
+        y_edges = [-1.0, 0.0, height * 0.33 - 0.01, height * 0.33, height * 0.67 - 0.01, height * 0.67,
+                   height, height + 0.5]
+        x_px = np.array(x_edges + [width / 2] * len(y_edges), dtype=np.float32)
+        y_px = np.array([height / 2] * len(x_edges) + y_edges, dtype=np.float32)
+        n = len(x_px)
+
+        columns = self.analyzer._allocate_columns(n + 2)
+        columns['screen_x_px'][:n] = x_px
+        columns['screen_y_px'][:n] = y_px
+        columns['detected'][:n + 1] = True
+        # A failed conversion keeps its 'unknown' zones; a frame without a face stays 'no_face'
+        columns['zone_horizontal'][n] = ZONE_CODES['zone_horizontal']['unknown']
+        columns['zone_vertical'][n] = ZONE_CODES['zone_vertical']['unknown']
+
+        self.analyzer._classify_gaze_zones(columns, 0, n + 2, SCREEN_INFO)
+
+        for i in range(n):
+            on_screen, h_zone, v_zone = _zone_per_frame(float(x_px[i]), float(y_px[i]), width, height)
+            self.assertEqual(columns['on_screen'][i], on_screen, f"x={x_px[i]}, y={y_px[i]}")
+            self.assertEqual(ZONE_CATEGORIES['zone_horizontal'][columns['zone_horizontal'][i]], h_zone,
+                             f"x={x_px[i]}")
+            self.assertEqual(ZONE_CATEGORIES['zone_vertical'][columns['zone_vertical'][i]], v_zone,
+                             f"y={y_px[i]}")
+        self.assertEqual(columns['zone_horizontal'][n], ZONE_CODES['zone_horizontal']['unknown'])
+        self.assertEqual(columns['zone_vertical'][n], ZONE_CODES['zone_vertical']['unknown'])
+        self.assertFalse(columns['on_screen'][n])
+        self.assertEqual(columns['zone_horizontal'][n + 1], ZONE_CODES['zone_horizontal']['no_face'])
+        self.assertFalse(columns['on_screen'][n + 1])
+
+    def test_run_lengths(self):
+        cases = [
+            [],
+            [False, False],
+            [True],
+            [True, True, False, True],
+            [False, True, True, False, False, True, True, True],
+            [True] * 5,
+        ]
+        cases += [list(self.rng.random(200) < 0.6) for _ in range(5)]
+        for mask in cases:
+            lengths = self.analyzer._run_lengths(np.array(mask, dtype=bool))
+            self.assertEqual(list(lengths), _run_lengths_per_frame(mask), mask)
+
+    def test_zone_change_count(self):
+        labels = ZONE_CATEGORIES['zone_horizontal']
+        cases = [
+            [],
+            ['left'],
+            ['left', 'left', 'left'],
+            ['no_face', 'left', 'left', 'center', 'right', 'right'],
+            ['center', 'left', 'center', 'left'],
+        ]
+        cases += [list(self.rng.choice(labels, 100)) for _ in range(5)]
+        for zones in cases:
+            # The first frame has no predecessor and is never counted as a change
+            expected = sum(1 for i in range(1, len(zones)) if zones[i] != zones[i - 1])
+            series = pd.Series(pd.Categorical(zones, categories=labels))
+            self.assertEqual(self.analyzer._zone_change_count(series), expected, zones)
+
+
+if __name__ == '__main__':
+    unittest.main()
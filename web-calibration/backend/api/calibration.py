@@ -654,7 +654,7 @@ async def download_calibration(
             elif filename.endswith(".npz"):
                 # Convert numpy data back to bytes
                 buffer = BytesIO()
-                np.savez_compressed(buffer, **content)
+                np.savez(buffer, **content)
                 npz_bytes = buffer.getvalue()
                 # Encode as base64 for JSON response
                 response_data[filename] = base64.b64encode(npz_bytes).decode("utf-8")
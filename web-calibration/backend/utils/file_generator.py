@@ -168,7 +168,7 @@ class FileGenerator:
         from io import BytesIO
 
         buffer = BytesIO()
-        np.savez_compressed(buffer, **arrays_to_save)
+        np.savez(buffer, **arrays_to_save)
         npz_bytes = buffer.getvalue()
 
         logger.info(